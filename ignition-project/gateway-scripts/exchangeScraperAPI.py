@@ -8,6 +8,15 @@ Uses camelCase naming convention per Ignition style guide
 
 # This module will be placed in: Project > Scripts > exchangeScraper > api
 
+import urllib
+
+# Conditional GET cache for makeApiCall: url -> (etag, decoded body)
+# Cleared when it grows past the limit (search URLs vary per keystroke)
+_etagCache = {}
+MAX_ETAG_CACHE_ENTRIES = 200
+
+_httpClient = None
+
 
 def getScraperServiceUrl():
 	"""
@@ -29,6 +38,27 @@ def getScraperServiceUrl():
 		return "http://localhost:5000"
 
 
+def getHttpClient():
+	"""
+	Shared HTTP client for GET requests (creating one per call is expensive)
+	"""
+	global _httpClient
+	if _httpClient is None:
+		_httpClient = system.net.httpClient()
+	return _httpClient
+
+
+def getHeader(response, name):
+	"""
+	Case-insensitive response header lookup
+	Returns the first value, or None if the header is missing
+	"""
+	for key, values in response.headers.items():
+		if key.lower() == name.lower():
+			return values[0] if values else None
+	return None
+
+
 def makeApiCall(endpoint, method='GET', body=None):
 	"""
 	Make HTTP call to scraper service API
@@ -40,18 +70,35 @@ def makeApiCall(endpoint, method='GET', body=None):
 
 	Returns:
 		Dictionary with response data, or None on error
+		GET responses carrying an ETag are cached and revalidated with
+		If-None-Match, so unchanged data is not re-downloaded
 	"""
 	baseUrl = getScraperServiceUrl()
 	url = baseUrl + endpoint
 
 	try:
 		if method == 'GET':
-			response = system.net.httpGet(url, headerValues={'Accept': 'application/json'})
-			if response:
-				return system.util.jsonDecode(response)
-			else:
+			# Revalidate with the stored ETag; a 304 reuses the cached body
+			headers = {'Accept': 'application/json'}
+			cached = _etagCache.get(url)
+			if cached:
+				headers['If-None-Match'] = cached[0]
+
+			response = getHttpClient().get(url, headers=headers)
+			if response.statusCode == 304 and cached:
+				return cached[1]
+			if not response.good:
+				print "API call to %s returned HTTP %d" % (url, response.statusCode)
 				return None
 
+			data = system.util.jsonDecode(response.text) if response.text else None
+			etag = getHeader(response, 'ETag')
+			if etag and data is not None:
+				if len(_etagCache) >= MAX_ETAG_CACHE_ENTRIES:
+					_etagCache.clear()
+				_etagCache[url] = (etag, data)
+			return data
+
 		elif method == 'POST':
 			headers = {
 				'Content-Type': 'application/json',
@@ -86,6 +133,19 @@ def makeApiCall(endpoint, method='GET', body=None):
 		return None
 
 
+def buildQueryString(params):
+	"""
+	Build a URL query string from a dictionary, skipping None values
+
+	Returns:
+		String starting with '?', or empty string when no params are set
+	"""
+	pairs = [(key, value) for key, value in params.items() if value is not None]
+	if not pairs:
+		return ''
+	return '?' + urllib.urlencode(pairs)
+
+
 def getScraperStatus():
 	"""
 	Get current scraper status
@@ -126,20 +186,93 @@ def stopScrape():
 	return makeApiCall('/api/scrape/control', method='POST', body=body)
 
 
-def getLatestResults(limit=None):
+def getLatestResults(limit=None, cursor=None, fields=None, contributor=None,
+                     version=None, updatedFrom=None, updatedTo=None,
+                     minVersion=None, maxVersion=None):
 	"""
 	Get latest scrape results
 
 	Args:
-		limit: Optional limit on number of results
+		limit: Optional page size
+		cursor: Optional next_cursor value from the previous page
+		fields: Optional list of columns (e.g. ['title', 'version'])
+		contributor: Optional exact contributor filter
+		version: Optional exact version filter
+		updatedFrom: Optional ISO date, earliest updated date
+		updatedTo: Optional ISO date, latest updated date
+		minVersion: Optional lowest version, compared numerically (1.10 > 1.9)
+		maxVersion: Optional highest version, compared numerically
 
 	Returns:
-		Dictionary with results array
+		Dictionary with results array and next_cursor (None on the last page)
 	"""
-	endpoint = '/api/results/latest'
-	if limit:
-		endpoint += '?limit=%d' % limit
-	return makeApiCall(endpoint, method='GET')
+	params = {
+		'limit': limit,
+		'cursor': cursor,
+		'fields': ','.join(fields) if fields else None,
+		'contributor': contributor,
+		'version': version,
+		'updated_from': updatedFrom,
+		'updated_to': updatedTo,
+		'min_version': minVersion,
+		'max_version': maxVersion
+	}
+	return makeApiCall('/api/results/latest' + buildQueryString(params), method='GET')
+
+
+def getUpdatedSince(jobId, minVersion=None):
+	"""
+	Get resources whose version changed after a job
+
+	Args:
+		jobId: Job id to compare against
+		minVersion: Optional lowest new version (e.g. '2.0')
+
+	Returns:
+		Dictionary with results (previous and new version), highest version first
+	"""
+	params = {
+		'job_id': jobId,
+		'min_version': minVersion
+	}
+	return makeApiCall('/api/results/updated-since' + buildQueryString(params), method='GET')
+
+
+def searchResources(query, limit=25, offset=0):
+	"""
+	Full-text search over resource title, tagline and contributor
+
+	Args:
+		query: Search text; each word is prefix-matched
+		limit: Page size (1-500)
+		offset: Number of matches to skip
+
+	Returns:
+		Dictionary with ranked results, total and next_offset (None on the last page)
+	"""
+	params = {
+		'q': query,
+		'limit': limit,
+		'offset': offset
+	}
+	return makeApiCall('/api/resources/search' + buildQueryString(params), method='GET')
+
+
+def getResourceHistory(resourceIds):
+	"""
+	Get the version, title and updated date timeline of several resources
+
+	Args:
+		resourceIds: List of resource ids (at most 500 per call)
+
+	Returns:
+		Dictionary with history array (only rows where something changed),
+		ordered by resource then job
+	"""
+	params = {
+		'ids': ','.join([str(resourceId) for resourceId in resourceIds])
+	}
+	return makeApiCall('/api/resources/history' + buildQueryString(params), method='GET')
 
 
 def getLatestChanges():
@@ -194,6 +327,33 @@ def getStatistics():
 	return makeApiCall('/api/stats', method='GET')
 
 
+def getDashboard(jobsLimit=10, logsLimit=50, sections=None, fields=None):
+	"""
+	Get everything a dashboard refresh needs in one call
+
+	Args:
+		jobsLimit: Number of jobs to retrieve (default 10)
+		logsLimit: Number of log entries to retrieve (default 50)
+		sections: Optional list of sections to include; any of 'status',
+			'statistics', 'jobs', 'changes', 'logs' (default all)
+		fields: Optional dictionary of section -> list of keys to keep
+			(e.g. {'jobs': ['Job ID', 'Status']})
+
+	Returns:
+		Dictionary with one entry per section, shaped like the results of
+		getScraperStatus, getStatistics, getRecentJobs, getLatestChanges
+		and getRecentLogs
+	"""
+	params = {
+		'sections': ','.join(sections) if sections else None,
+		'jobs_limit': jobsLimit,
+		'logs_limit': logsLimit
+	}
+	for section, keys in (fields or {}).items():
+		params[section + '_fields'] = ','.join(keys)
+	return makeApiCall('/api/dashboard' + buildQueryString(params), method='GET')
+
+
 def testConnection():
 	"""
 	Test connection to scraper service
@@ -0,0 +1,18 @@
+-- Named Query: GetResourceHistory
+-- Description: Version, title and updated date timeline of one or more resources
+-- Parameters: ids (string, comma-separated resource ids, e.g. '12,40,41')
+-- Returns: Only the history rows where one of those changed, per resource
+--          oldest first; load every popup's history with one query
+
+SELECT
+    resource_id AS "Resource ID",
+    job_id AS "Job ID",
+    scraped_at AS "Scraped At",
+    change_type AS "Change Type",
+    title AS "Title",
+    version AS "Version",
+    updated_date AS "Updated Date",
+    previous_title AS "Previous Title",
+    previous_version AS "Previous Version",
+    previous_updated_date AS "Previous Updated Date"
+FROM get_resource_history(string_to_array(:ids, ',')::INTEGER[]);
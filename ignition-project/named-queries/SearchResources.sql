@@ -0,0 +1,18 @@
+-- Named Query: SearchResources
+-- Description: Ranked full-text search over resource title, tagline and contributor
+-- Parameters: query (string), limit (integer, default 25), offset (integer, default 0)
+-- Returns: Matching resources, best match first; each word is prefix-matched
+--          so the query can run on every keystroke of a search box
+
+SELECT
+    resource_id AS "Resource ID",
+    title AS "Title",
+    url AS "URL",
+    version AS "Version",
+    updated_date AS "Updated Date",
+    developer_id AS "Developer ID",
+    contributor AS "Contributor",
+    tagline AS "Tagline",
+    rank AS "Rank",
+    total_count AS "Total Matches"
+FROM search_resources(:query, :limit, :offset);
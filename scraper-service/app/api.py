@@ -3,20 +3,43 @@ FastAPI application for Exchange scraper service
 Provides REST API for Ignition gateway to trigger and monitor scraping
 """
 
+import asyncio
+import hashlib
 import logging
-import subprocess
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import contextmanager_in_threadpool, run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.routing import Match
 
+from .cache import ResultCache
 from .config import get_settings
-from .database import DatabaseManager
-from .scraper_engine import ScraperEngine
+from .database import (
+    DASHBOARD_SECTIONS,
+    JOB_CONTROL_ACTIONS,
+    JOB_EVENTS_CHANNEL,
+    DatabaseManager,
+    DatabasePool,
+)
+from .events import PROGRESS_EVENTS_CHANNEL, EventBroadcaster, listen_for_notifications
+from .exporters import (
+    ENCODERS,
+    EXPORT_FORMATS,
+    EXPORT_TABLES,
+    export_parquet,
+    exported_job_ids,
+    gzip_stream,
+)
+from .log_writer import LogWriter
+from .metrics import METRICS_ENABLED, record_request, render_metrics
+from .responses import FastJSONResponse, PreparedBody, json_response
+from .supervisor import OutputWriter, ScrapeSupervisor
 
 # Configure logging
 logging.basicConfig(
@@ -29,11 +52,29 @@ app = FastAPI(
     title="Ignition Exchange Scraper Service",
     description="Web scraping service for the Ignition Exchange platform",
     version="3.0.0",
+    default_response_class=FastJSONResponse,
 )
 
-# Global state
-scraper_engine: Optional[ScraperEngine] = None
-db_manager: Optional[DatabaseManager] = None
+# Per-process resources. Job state, control, progress and scraper output
+# live in Postgres (caches and event streams follow it over LISTEN/NOTIFY),
+# so any number of uvicorn workers can serve the API.
+db_pool: Optional[DatabasePool] = None
+result_cache = ResultCache()
+event_broadcaster = EventBroadcaster()
+notification_listener: Optional[asyncio.Task] = None
+stale_job_task: Optional[asyncio.Task] = None
+log_writer: Optional[LogWriter] = None
+output_writer: Optional[OutputWriter] = None
+supervisor: Optional[ScrapeSupervisor] = None
+
+# Most resource ids accepted by one /api/resources/history request
+MAX_HISTORY_IDS = 500
+
+# Largest page size of /api/results/latest (omit limit for every row)
+MAX_RESULTS_LIMIT = 1000
+
+# triggered_by of the replacement scrape started for a reaped job
+STALE_JOB_RETRY_TRIGGER = "stale-retry"
 
 
 # Pydantic models
@@ -47,26 +88,105 @@ class ScrapeStatus(BaseModel):
     progress: Optional[Dict[str, Any]] = None
     elapsed_seconds: Optional[int] = None
     estimated_remaining_seconds: Optional[int] = None
+    worker: Optional[Dict[str, Any]] = None  # scraper subprocess (pid, usage)
 
 
 class ControlAction(BaseModel):
     action: str  # 'pause', 'resume', 'stop'
+    job_id: Optional[int] = None  # defaults to the active job
+
+
+class CompactRequest(BaseModel):
+    older_than_days: int = Field(90, ge=0)
+    batch_size: int = Field(5000, ge=1)
+    dry_run: bool = True
+
+
+def get_db() -> Iterator[DatabaseManager]:
+    """Request-scoped database connection borrowed from the pool"""
+    if not db_pool:
+        raise HTTPException(status_code=503, detail="Database not initialized")
+    with db_pool.connection() as db:
+        yield db
+
+
+def _pooled(query: Callable[[DatabaseManager], Any]) -> Callable[[], Any]:
+    """
+    Cache loader running query on its own pooled connection
+    A load can outlive the request that started it (see ResultCache.get),
+    so it must not use the request's connection.
+    """
+
+    def load():
+        with db_pool.connection() as db:
+            return query(db)
+
+    return load
 
 
 # Startup/shutdown events
 @app.on_event("startup")
 async def startup_event():
-    """Initialize scraper engine and database connection"""
-    global scraper_engine, db_manager
+    """Initialize database connection and background tasks"""
+    global db_pool, result_cache, notification_listener
+    global stale_job_task, log_writer, output_writer, supervisor
 
     logger.info("Starting Exchange Scraper Service...")
 
-    # Initialize database
+    # Initialize database (open the first connection now to fail fast)
     settings = get_settings()
-    db_manager = DatabaseManager(settings.database_url)
+    db_pool = DatabasePool(settings.database_url, size=settings.db_pool_size)
+    with db_pool.connection():
+        pass
 
-    # Initialize scraper engine
-    scraper_engine = ScraperEngine(db_manager=db_manager, headless=True)
+    # Result cache, enabled while the job event listener is connected
+    result_cache = ResultCache(
+        ttl=settings.result_cache_ttl, max_entries=settings.result_cache_max_entries
+    )
+
+    # One LISTEN connection feeds cache eviction and the SSE event stream
+    def handle_job_event(payload: str):
+        result_cache.handle_event(payload)
+        event_broadcaster.handle_job_notification(payload)
+
+    notification_listener = asyncio.create_task(
+        listen_for_notifications(
+            settings.database_url,
+            {
+                JOB_EVENTS_CHANNEL: handle_job_event,
+                PROGRESS_EVENTS_CHANNEL: event_broadcaster.handle_progress_notification,
+            },
+            on_connect=(
+                result_cache.activate if settings.result_cache_enabled else None
+            ),
+            on_disconnect=result_cache.deactivate,
+        )
+    )
+
+    # Scraper subprocess output goes to scrape_output, failures to the
+    # activity log
+    log_writer = LogWriter(
+        settings.database_url,
+        flush_interval=settings.log_flush_interval,
+        batch_size=settings.log_batch_size,
+        min_level=settings.db_log_level,
+    )
+    log_writer.start()
+    output_writer = OutputWriter(
+        settings.database_url,
+        keep_lines=settings.worker_output_lines,
+        flush_interval=settings.log_flush_interval,
+        batch_size=settings.log_batch_size,
+    )
+    output_writer.start()
+    supervisor = ScrapeSupervisor(
+        db_pool, output_writer=output_writer, log_writer=log_writer
+    )
+
+    # Fail jobs whose worker process died without finishing them
+    stale_job_task = asyncio.create_task(
+        stale_job_reaper(settings.stale_job_check_interval)
+    )
 
     logger.info("Service started successfully")
 
@@ -74,19 +194,166 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    global scraper_engine, db_manager
+    global db_pool, notification_listener, stale_job_task
+    global log_writer, output_writer
 
     logger.info("Shutting down Exchange Scraper Service...")
 
-    if scraper_engine:
-        scraper_engine.stop()
-
-    if db_manager:
-        db_manager.close()
+    for task in (notification_listener, stale_job_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    notification_listener = None
+    stale_job_task = None
+
+    if supervisor:
+        await supervisor.close()
+    for writer in (output_writer, log_writer):
+        if writer:
+            writer.close()
+    output_writer = None
+    log_writer = None
+
+    if db_pool:
+        db_pool.close()
 
     logger.info("Service shutdown complete")
 
 
+# Conditional GET
+# Read endpoints whose payload only changes with job state, mapped to the
+# DatabaseManager.get_data_version() key their ETag is derived from
+CONDITIONAL_ENDPOINTS = {
+    "/api/results/latest": "results",
+    "/api/results/changes": "results",
+    "/api/results/updated-since": "results",
+    "/api/resources/search": "results",
+    "/api/resources/history": "results",
+    "/api/stats": "jobs",
+    "/api/jobs/recent": "jobs",
+    "/api/dashboard": "dashboard",
+}
+
+# Dashboard sections that only change on job events, cached in the "jobs"
+# scope; status and logs are always read live
+CACHED_DASHBOARD_SECTIONS = ("statistics", "jobs", "changes")
+
+
+def _make_etag(request: Request, version: str) -> str:
+    """Strong ETag for this URL (path and query) at the given data version"""
+    key = f"{request.url.path}?{request.url.query}|{version}"
+    return '"' + hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _base_etag(tag: str) -> str:
+    """Strip the weak prefix and any content-coding suffix ("<hash>-br")"""
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    return tag.split("-", 1)[0] + '"' if "-" in tag else tag
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison and may list several tags or *"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (_base_etag(tag) for tag in candidates)
+
+
+def _json(request: Request, content) -> Response:
+    """orjson response, compressed above the configured size"""
+    return json_response(
+        request, content, min_size=get_settings().response_compression_min_size
+    )
+
+
+async def _json_async(request: Request, content) -> Response:
+    """
+    _json for async routes: serialising and compressing a large body takes
+    hundreds of milliseconds, so it runs in the threadpool
+    """
+    return await run_in_threadpool(_json, request, content)
+
+
+def _split_list(value: Optional[str]) -> Optional[List[str]]:
+    """Comma-separated query parameter as a list (None if empty)"""
+    items = [item.strip() for item in value.split(",") if item.strip()] if value else []
+    return items or None
+
+
+def _data_versions() -> Dict[str, str]:
+    """Current validators of every CONDITIONAL_ENDPOINTS scope"""
+    with db_pool.connection() as db:
+        return db.get_data_version()
+
+
+def _cache_version(request: Request, scope: str) -> Optional[str]:
+    """
+    Data version this request's ETag was built from (see conditional_get)
+    Part of result cache keys: until the NOTIFY evicting an entry arrives,
+    a body cached at an older version must not go out with the new ETag,
+    or clients would revalidate that stale body until the next job ends.
+    """
+    return getattr(request.state, "data_versions", {}).get(scope)
+
+
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    """Answer If-None-Match with 304 before the endpoint queries anything"""
+    scope = CONDITIONAL_ENDPOINTS.get(request.url.path)
+    if request.method != "GET" or scope is None or not db_pool:
+        return await call_next(request)
+
+    try:
+        versions = await run_in_threadpool(_data_versions)
+    except Exception as e:
+        logger.warning(f"Skipping ETag for {request.url.path}: {e}")
+        return await call_next(request)
+
+    request.state.data_versions = versions
+    etag = _make_etag(request, versions[scope])
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code == 200:
+        # Each content coding is a distinct representation
+        encoding = response.headers.get("content-encoding")
+        if encoding:
+            headers["ETag"] = f'{etag[:-1]}-{encoding}"'
+        response.headers.update(headers)
+    return response
+
+
+def _route_template(request: Request) -> str:
+    """Path template of the route a request will be dispatched to"""
+    for route in app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+
+@app.middleware("http")
+async def request_metrics(request: Request, call_next):
+    """
+    Record request latency per route template
+    Outermost middleware, so 304s answered by conditional_get count too; the
+    route is matched up front since those never reach the router.
+    """
+    route = _route_template(request)
+    started = time.perf_counter()
+    response = await call_next(request)
+    record_request(
+        request.method, route, response.status_code, time.perf_counter() - started
+    )
+    return response
+
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -98,18 +365,27 @@ async def health_check():
     }
 
 
-# Scraper control endpoints
-@app.post("/api/scrape/start")
-async def start_scrape(request: ScrapeRequest):
-    """Start a new scraping job"""
-    if not db_manager:
-        raise HTTPException(status_code=503, detail="Database not initialized")
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics of the API workers and the scraper subprocess"""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    body, content_type = render_metrics()
+    return Response(content=body, headers={"Content-Type": content_type})
 
-    if scraper_engine and scraper_engine.is_running():
-        raise HTTPException(status_code=409, detail="Scrape already in progress")
 
+# Scraper control endpoints
+async def launch_scrape(db: DatabaseManager, triggered_by: str) -> Optional[int]:
+    """
+    Create a job and start the scraper CLI subprocess for it
+    Returns the job ID, or None if another job is already running
+    """
     # Create job record first
-    job_id = db_manager.create_job(triggered_by=request.triggered_by)
+    job_id = await run_in_threadpool(
+        db.create_job, triggered_by=triggered_by, only_if_idle=True
+    )
+    if job_id is None:
+        return None
 
     # Get path to CLI script
     cli_path = Path(__file__).parent.parent / "cli.py"
@@ -122,152 +398,476 @@ async def start_scrape(request: ScrapeRequest):
         "--job-id",
         str(job_id),
         "--triggered-by",
-        request.triggered_by,
+        triggered_by,
         "--headless",
     ]
 
     try:
-        # Start process in background
-        subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True
+        # Start process in background; its output is drained by the supervisor
+        pid = await supervisor.start(cmd, job_id)
+    except Exception as e:
+        logger.error(f"Failed to start scraper subprocess: {e}")
+        await run_in_threadpool(
+            db.fail_job,
+            job_id,
+            error_message=f"Failed to start: {str(e)}",
+            elapsed_seconds=0,
         )
+        raise
 
-        logger.info(
-            f"Scrape started via subprocess (job #{job_id}, triggered by: {request.triggered_by})"
-        )
+    logger.info(
+        f"Scrape started via subprocess (job #{job_id}, pid {pid}, "
+        f"triggered by: {triggered_by})"
+    )
+    return job_id
 
-        return {
-            "success": True,
-            "message": "Scrape started",
-            "job_id": job_id,
-            "triggered_by": request.triggered_by,
-        }
+
+async def reap_stale_jobs(db: DatabaseManager):
+    """Fail jobs whose worker died, optionally starting a replacement scrape"""
+    settings = get_settings()
+    jobs = await run_in_threadpool(db.reap_stale_jobs, settings.stale_job_timeout)
+    if not (jobs and settings.stale_job_retry):
+        return
+
+    # One retry per crash; a retry that dies as well is left failed
+    job = jobs[0]
+    if job["triggered_by"] == STALE_JOB_RETRY_TRIGGER:
+        return
+    try:
+        await launch_scrape(db, STALE_JOB_RETRY_TRIGGER)
+    except Exception as e:
+        logger.error(f"Could not restart scrape after job #{job['id']}: {e}")
+
+
+async def stale_job_reaper(interval: float):
+    """Periodically reap stale jobs until cancelled (safe in every API worker)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with contextmanager_in_threadpool(db_pool.connection()) as db:
+                await reap_stale_jobs(db)
+        except Exception as e:
+            logger.error(f"Stale job check failed: {e}")
+
+
+@app.post("/api/scrape/start")
+async def start_scrape(request: ScrapeRequest, db: DatabaseManager = Depends(get_db)):
+    """Start a new scraping job"""
+    # A job left 'running' by a dead worker must not block new scrapes
+    try:
+        await reap_stale_jobs(db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    try:
+        job_id = await launch_scrape(db, request.triggered_by)
     except Exception as e:
-        logger.error(f"Failed to start scraper subprocess: {e}")
-        db_manager.fail_job(
-            job_id, error_message=f"Failed to start: {str(e)}", elapsed_seconds=0
-        )
         raise HTTPException(
             status_code=500, detail=f"Failed to start scraper: {str(e)}"
         )
+    if job_id is None:
+        raise HTTPException(status_code=409, detail="Scrape already in progress")
+
+    return {
+        "success": True,
+        "message": "Scrape started",
+        "job_id": job_id,
+        "triggered_by": request.triggered_by,
+    }
+
+
+def _build_scrape_status(
+    job: Optional[Dict[str, Any]], last_worker: Optional[Dict[str, Any]]
+) -> ScrapeStatus:
+    """ScrapeStatus from get_active_job_progress() (None when idle)"""
+    if not job:
+        # No active job
+        return ScrapeStatus(
+            status="idle",
+            job_id=None,
+            progress={
+                "current": 0,
+                "total": 0,
+                "current_item": "",
+                "percentage": 0,
+                "avg_item_ms": None,
+            },
+            elapsed_seconds=0,
+            estimated_remaining_seconds=None,
+            worker=last_worker,
+        )
+
+    # Before the first progress update (still loading the resource list)
+    # only the job row is available
+    current = job["current"] if job["current"] is not None else job["resources_found"]
+    current = current or 0
+    total = job["total"] or 0
+    avg_item_ms = job["avg_item_ms"]
+
+    estimated_remaining = None
+    if total and avg_item_ms is not None:
+        estimated_remaining = int(max(total - current, 0) * avg_item_ms / 1000)
+
+    return ScrapeStatus(
+        status=job["status"],
+        job_id=job["job_id"],
+        progress={
+            "current": current,
+            "total": total,
+            "current_item": job["current_item"] or "",
+            "percentage": int(current / total * 100) if total else 0,
+            "avg_item_ms": avg_item_ms,
+            "updated_at": job["progress_updated_at"],
+        },
+        elapsed_seconds=job["elapsed_seconds"] or 0,
+        estimated_remaining_seconds=estimated_remaining,
+        worker=job["worker"],
+    )
 
 
 @app.get("/api/scrape/status")
-async def get_scrape_status() -> ScrapeStatus:
+def get_scrape_status(db: DatabaseManager = Depends(get_db)) -> ScrapeStatus:
     """Get current scraping status"""
-    if not db_manager:
-        raise HTTPException(status_code=503, detail="Database not initialized")
-
-    # Get status from database (works with subprocess scraper)
+    # Job row plus the progress the worker subprocess saves to scrape_progress
     try:
-        with db_manager.conn.cursor() as cur:
-            # Query most recent running/paused job
-            cur.execute(
-                """
-                SELECT id, job_start_time, status, resources_found,
-                       EXTRACT(EPOCH FROM (NOW() - job_start_time))::integer as elapsed_seconds
-                FROM scrape_jobs
-                WHERE status IN ('running', 'paused')
-                ORDER BY job_start_time DESC
-                LIMIT 1
-            """
-            )
-            result = cur.fetchone()
-
-            if result:
-                job_id, start_time, status, resources_found, elapsed_seconds = result
-
-                # For progress, we can't track detailed progress from subprocess
-                # but we can show resources found so far
-                return ScrapeStatus(
-                    status=status,
-                    job_id=job_id,
-                    progress={
-                        "current": resources_found if resources_found else 0,
-                        "total": 0,  # Unknown until scrape completes
-                        "current_item": "",
-                        "percentage": 0,
-                    },
-                    elapsed_seconds=int(elapsed_seconds) if elapsed_seconds else 0,
-                    estimated_remaining_seconds=None,
-                )
-            else:
-                # No active job
-                return ScrapeStatus(
-                    status="idle",
-                    job_id=None,
-                    progress={
-                        "current": 0,
-                        "total": 0,
-                        "current_item": "",
-                        "percentage": 0,
-                    },
-                    elapsed_seconds=0,
-                    estimated_remaining_seconds=None,
-                )
+        job = db.get_active_job_progress()
+        # Without an active job, report how the last worker process ended
+        last_worker = None if job else db.get_latest_worker()
     except Exception as e:
         logger.error(f"Error fetching scrape status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    return _build_scrape_status(job, last_worker)
+
+
+@app.get("/api/scrape/events")
+async def scrape_events():
+    """
+    Server-Sent Events stream of the running job
+
+    Events: `progress` (current/total, current item, percentage, elapsed and
+    estimated remaining seconds), `log` (activity log lines) and `job`
+    (started/completed/failed). New clients first receive the latest
+    progress snapshot. All clients share one database listener.
+    """
+    return StreamingResponse(
+        event_broadcaster.subscribe(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/scrape/output")
+def get_scrape_output(lines: int = 100, db: DatabaseManager = Depends(get_db)):
+    """Latest stdout/stderr lines captured from the scraper subprocess"""
+    try:
+        output = db.get_worker_output(limit=max(lines, 0))
+    except Exception as e:
+        logger.error(f"Error fetching scraper output: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "success": True,
+        "job_id": output[-1]["job_id"] if output else None,
+        "count": len(output),
+        "lines": [
+            {
+                "timestamp": row["timestamp"],
+                "stream": row["stream"],
+                "line": row["line"],
+            }
+            for row in output
+        ],
+    }
+
 
 @app.post("/api/scrape/control")
-async def control_scrape(control: ControlAction):
-    """Control running scrape (pause, resume, stop)"""
-    if not scraper_engine:
-        raise HTTPException(status_code=503, detail="Scraper engine not initialized")
+def control_scrape(control: ControlAction, db: DatabaseManager = Depends(get_db)):
+    """
+    Control running scrape (pause, resume, stop)
 
+    The request is recorded on the job and pushed to the worker process
+    running it, which applies it before the next resource.
+    """
     action = control.action.lower()
-
-    if action == "pause":
-        scraper_engine.pause()
-        return {"success": True, "message": "Scrape paused"}
-    elif action == "resume":
-        scraper_engine.resume()
-        return {"success": True, "message": "Scrape resumed"}
-    elif action == "stop":
-        scraper_engine.stop()
-        return {"success": True, "message": "Scrape stopped"}
-    else:
+    if action not in JOB_CONTROL_ACTIONS:
         raise HTTPException(status_code=400, detail=f"Invalid action: {action}")
 
+    try:
+        job_id = db.request_job_control(action, job_id=control.job_id)
+    except Exception as e:
+        logger.error(f"Error sending '{action}' to scraper: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if job_id is None:
+        raise HTTPException(status_code=409, detail="No running scrape to control")
+
+    messages = {
+        "pause": "Scrape paused",
+        "resume": "Scrape resumed",
+        "stop": "Scrape stopping",
+    }
+    return {"success": True, "message": messages[action], "job_id": job_id}
+
 
 # Data retrieval endpoints
 @app.get("/api/results/latest")
-async def get_latest_results(limit: Optional[int] = None):
-    """Get latest scrape results"""
-    if not db_manager:
-        raise HTTPException(status_code=503, detail="Database not initialized")
+async def get_latest_results(
+    request: Request,
+    limit: Optional[int] = None,
+    cursor: Optional[int] = None,
+    fields: Optional[str] = None,
+    contributor: Optional[str] = None,
+    version: Optional[str] = None,
+    updated_from: Optional[datetime] = None,
+    updated_to: Optional[datetime] = None,
+    min_version: Optional[str] = None,
+    max_version: Optional[str] = None,
+):
+    """
+    Get latest scrape results
+
+    Pass `limit` for a page and follow `next_cursor` for the next one;
+    `fields` is a comma-separated column list (e.g. title,version).
+    `min_version`/`max_version` compare numerically (1.10 > 1.9).
+    """
+    if limit is not None and not 1 <= limit <= MAX_RESULTS_LIMIT:
+        raise HTTPException(
+            status_code=400, detail=f"limit must be 1-{MAX_RESULTS_LIMIT}"
+        )
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+
+    def load(db: DatabaseManager) -> PreparedBody:
+        results = db.get_latest_results(
+            limit=limit,
+            after=cursor,
+            fields=field_list,
+            contributor=contributor,
+            version=version,
+            updated_from=updated_from,
+            updated_to=updated_to,
+            min_version=min_version,
+            max_version=max_version,
+        )
+        next_cursor = None
+        if limit and len(results) == limit:
+            next_cursor = results[-1]["Resource ID"]
+        return PreparedBody(
+            {
+                "success": True,
+                "count": len(results),
+                "results": results,
+                "next_cursor": next_cursor,
+            }
+        )
 
     try:
-        results = db_manager.get_latest_results(limit=limit)
-        return {"success": True, "count": len(results), "results": results}
+        body = await result_cache.get(
+            (
+                "results",
+                "latest",
+                _cache_version(request, "results"),
+                limit,
+                cursor,
+                tuple(field_list or ()),
+                contributor,
+                version,
+                updated_from,
+                updated_to,
+                min_version,
+                max_version,
+            ),
+            _pooled(load),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching latest results: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    return await _json_async(request, body)
+
+
+@app.get("/api/results/updated-since")
+def get_updated_since(
+    job_id: int,
+    min_version: Optional[str] = None,
+    db: DatabaseManager = Depends(get_db),
+):
+    """
+    Get resources whose version changed after a job
+
+    e.g. ?job_id=120&min_version=2.0 lists resources moved to 2.0 or later
+    since job #120, highest version first.
+    """
+    try:
+        results = db.get_updated_since(job_id, min_version=min_version)
+        return {
+            "success": True,
+            "since_job": job_id,
+            "count": len(results),
+            "results": results,
+        }
+    except Exception as e:
+        logger.error(f"Error fetching resources updated since job #{job_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/resources/search")
+def search_resources(
+    q: str, limit: int = 25, offset: int = 0, db: DatabaseManager = Depends(get_db)
+):
+    """
+    Ranked full-text search over title, tagline and contributor
+
+    Every word is prefix-matched ("persp comp" finds "Perspective Component").
+    Page with `limit`/`offset`; `total` is the number of matches.
+    """
+    if not 1 <= limit <= 500 or offset < 0:
+        raise HTTPException(
+            status_code=400, detail="limit must be 1-500 and offset >= 0"
+        )
+
+    try:
+        results, total = db.search_resources(q, limit=limit, offset=offset)
+    except Exception as e:
+        logger.error(f"Error searching resources: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    next_offset = offset + len(results)
+    return {
+        "success": True,
+        "query": q,
+        "total": total,
+        "count": len(results),
+        "results": results,
+        "next_offset": next_offset if next_offset < total else None,
+    }
+
+
+@app.get("/api/resources/history")
+async def get_resource_history(request: Request, ids: str):
+    """
+    Get the version, title and updated date timeline of several resources
+
+    `ids` is a comma-separated list of resource ids (e.g. ?ids=12,40,41).
+    Only history rows where one of those changed are returned, ordered by
+    resource then job.
+    """
+    try:
+        resource_ids = sorted({int(i) for i in _split_list(ids) or []})
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be integers")
+    if not resource_ids:
+        raise HTTPException(status_code=400, detail="No resource ids given")
+    if len(resource_ids) > MAX_HISTORY_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_HISTORY_IDS} ids per request"
+        )
+
+    def load(db: DatabaseManager) -> PreparedBody:
+        history = db.get_resource_history(resource_ids)
+        return PreparedBody(
+            {"success": True, "count": len(history), "history": history}
+        )
+
+    try:
+        body = await result_cache.get(
+            (
+                "results",
+                "history",
+                _cache_version(request, "results"),
+                tuple(resource_ids),
+            ),
+            _pooled(load),
+        )
+        return await _json_async(request, body)
+    except Exception as e:
+        logger.error(f"Error fetching resource history: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/results/as-of")
+def get_results_as_of(
+    request: Request, job_id: int, db: DatabaseManager = Depends(get_db)
+):
+    """Get the full catalog as it stood after a completed job"""
+    try:
+        results = db.get_results_as_of(job_id)
+    except Exception as e:
+        logger.error(f"Error fetching results as of job #{job_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if results is None:
+        raise HTTPException(
+            status_code=404, detail=f"Job #{job_id} not found or not completed"
+        )
+    return _json(
+        request,
+        {
+            "success": True,
+            "job_id": job_id,
+            "count": len(results),
+            "results": results,
+        },
+    )
+
+
+@app.get("/api/results/diff")
+def get_results_diff(
+    request: Request, from_job: int, to_job: int, db: DatabaseManager = Depends(get_db)
+):
+    """Get added, removed and changed resources between two completed jobs"""
+    try:
+        diff = db.get_job_diff(from_job, to_job)
+    except Exception as e:
+        logger.error(f"Error diffing jobs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if diff is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Jobs #{from_job} and #{to_job} must both exist and be completed",
+        )
+    return _json(
+        request,
+        {
+            "success": True,
+            "from_job": from_job,
+            "to_job": to_job,
+            "counts": {kind: len(items) for kind, items in diff.items()},
+            **diff,
+        },
+    )
+
 
 @app.get("/api/results/changes")
-async def get_latest_changes():
+async def get_latest_changes(request: Request):
     """Get changes from most recent scrape"""
-    if not db_manager:
-        raise HTTPException(status_code=503, detail="Database not initialized")
+
+    def load(db: DatabaseManager) -> PreparedBody:
+        changes = db.get_latest_changes()
+        return PreparedBody(
+            {"success": True, "count": len(changes), "changes": changes}
+        )
 
     try:
-        changes = db_manager.get_latest_changes()
-        return {"success": True, "count": len(changes), "changes": changes}
+        body = await result_cache.get(
+            ("results", "changes", _cache_version(request, "results")), _pooled(load)
+        )
+        return await _json_async(request, body)
     except Exception as e:
         logger.error(f"Error fetching changes: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/jobs/recent")
-async def get_recent_jobs(limit: int = 10):
+async def get_recent_jobs(request: Request, limit: int = 10):
     """Get recent job history"""
-    if not db_manager:
-        raise HTTPException(status_code=503, detail="Database not initialized")
-
     try:
-        jobs = db_manager.get_recent_jobs(limit=limit)
+        jobs = await result_cache.get(
+            ("jobs", "recent", _cache_version(request, "jobs"), limit),
+            _pooled(lambda db: db.get_recent_jobs(limit=limit)),
+        )
         return {"success": True, "count": len(jobs), "jobs": jobs}
     except Exception as e:
         logger.error(f"Error fetching job history: {e}")
@@ -275,27 +875,106 @@ async def get_recent_jobs(limit: int = 10):
 
 
 @app.get("/api/logs/recent")
-async def get_recent_logs(limit: int = 50):
+def get_recent_logs(
+    request: Request, limit: int = 50, db: DatabaseManager = Depends(get_db)
+):
     """Get recent activity logs"""
-    if not db_manager:
-        raise HTTPException(status_code=503, detail="Database not initialized")
-
     try:
-        logs = db_manager.get_recent_logs(limit=limit)
-        return {"success": True, "count": len(logs), "logs": logs}
+        logs = db.get_recent_logs(limit=limit)
+        return _json(request, {"success": True, "count": len(logs), "logs": logs})
     except Exception as e:
         logger.error(f"Error fetching logs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/dashboard")
+async def get_dashboard(
+    request: Request,
+    sections: Optional[str] = None,
+    jobs_limit: int = Query(10, ge=1, le=50),
+    logs_limit: int = Query(50, ge=1, le=1000),
+    status_fields: Optional[str] = None,
+    statistics_fields: Optional[str] = None,
+    jobs_fields: Optional[str] = None,
+    changes_fields: Optional[str] = None,
+    logs_fields: Optional[str] = None,
+    db: DatabaseManager = Depends(get_db),
+):
+    """
+    Get status, statistics, recent jobs, latest changes and recent logs in
+    one response (statistics, jobs and changes from the result cache, status
+    and logs with a single query)
+
+    `sections` is a comma-separated subset of those (default: all);
+    `<section>_fields` keeps only the listed keys of that section (of each
+    row for jobs, changes and logs), e.g. jobs_fields=Job ID,Status.
+    """
+    wanted = _split_list(sections) or list(DASHBOARD_SECTIONS)
+    selected = {
+        "status": _split_list(status_fields),
+        "statistics": _split_list(statistics_fields),
+        "jobs": _split_list(jobs_fields),
+        "changes": _split_list(changes_fields),
+        "logs": _split_list(logs_fields),
+    }
+
+    cached = tuple(name for name in wanted if name in CACHED_DASHBOARD_SECTIONS)
+    live = [name for name in wanted if name not in CACHED_DASHBOARD_SECTIONS]
+
+    try:
+        data = {}
+        if cached:
+            data.update(
+                await result_cache.get(
+                    (
+                        "jobs",
+                        "dashboard",
+                        _cache_version(request, "jobs"),
+                        cached,
+                        jobs_limit,
+                    ),
+                    _pooled(lambda db: db.get_dashboard(cached, jobs_limit=jobs_limit)),
+                )
+            )
+        if live:
+            data.update(
+                await run_in_threadpool(db.get_dashboard, live, logs_limit=logs_limit)
+            )
+        if "status" in data:
+            last_worker = data.pop("last_worker")
+            data["status"] = _build_scrape_status(
+                data["status"], last_worker
+            ).model_dump()
+        content = {"success": True}
+        for name in wanted:
+            content[name] = _select_fields(name, data[name], selected[name])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching dashboard: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return await _json_async(request, content)
+
+
+def _select_fields(section: str, value, fields: Optional[List[str]]):
+    """Keep only `fields` of a dashboard section (of each row for lists)"""
+    if not fields or value is None:
+        return value
+    rows = value if isinstance(value, list) else [value]
+    if rows:
+        unknown = [f for f in fields if f not in rows[0]]
+        if unknown:
+            raise ValueError(f"Unknown {section} fields: {', '.join(unknown)}")
+    rows = [{f: row[f] for f in fields} for row in rows]
+    return rows if isinstance(value, list) else rows[0]
+
+
 @app.post("/api/logs/clear")
-async def clear_logs():
+def clear_logs(db: DatabaseManager = Depends(get_db)):
     """Clear activity logs (keep last 7 days)"""
-    if not db_manager:
-        raise HTTPException(status_code=503, detail="Database not initialized")
-
     try:
-        deleted_count = db_manager.clear_old_logs()
+        deleted_count = db.clear_old_logs()
         return {"success": True, "message": f"Cleared {deleted_count} old log entries"}
     except Exception as e:
         logger.error(f"Error clearing logs: {e}")
@@ -303,19 +982,153 @@ async def clear_logs():
 
 
 @app.get("/api/stats")
-async def get_statistics():
+async def get_statistics(request: Request):
     """Get scraper statistics"""
-    if not db_manager:
-        raise HTTPException(status_code=503, detail="Database not initialized")
-
     try:
-        stats = db_manager.get_statistics()
+        stats = await result_cache.get(
+            ("jobs", "stats", _cache_version(request, "jobs")),
+            _pooled(DatabaseManager.get_statistics),
+        )
         return {"success": True, "statistics": stats}
     except Exception as e:
         logger.error(f"Error fetching statistics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/stats/daily")
+def get_daily_statistics(days: int = 30, db: DatabaseManager = Depends(get_db)):
+    """Get per-day job rollups"""
+    try:
+        daily = db.get_daily_statistics(days=days)
+        return {"success": True, "count": len(daily), "daily": daily}
+    except Exception as e:
+        logger.error(f"Error fetching daily statistics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Bulk export endpoints
+def _run_parquet_export(export_dir: str):
+    """Background Parquet export on a dedicated connection"""
+    export_db = DatabaseManager(get_settings().database_url)
+    try:
+        summary = export_parquet(export_db, export_dir)
+        export_db.add_log(
+            f"Parquet export wrote {len(summary['exported_jobs'])} jobs "
+            f"({summary['history_rows']} history rows)",
+            "info",
+        )
+    except Exception as e:
+        logger.error(f"Parquet export failed: {e}")
+        export_db.add_log(f"Parquet export failed: {e}", "error")
+    finally:
+        export_db.close()
+
+
+@app.post("/api/export/parquet")
+def start_parquet_export(
+    background_tasks: BackgroundTasks, db: DatabaseManager = Depends(get_db)
+):
+    """Append jobs finished since the last export to the Parquet dataset"""
+    export_dir = get_settings().export_dir
+    try:
+        done = exported_job_ids(export_dir)
+        pending = [job["id"] for job in db.get_finished_jobs() if job["id"] not in done]
+    except Exception as e:
+        logger.error(f"Error preparing Parquet export: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if pending:
+        background_tasks.add_task(_run_parquet_export, export_dir)
+    return {
+        "success": True,
+        "message": "Parquet export started" if pending else "Nothing new to export",
+        "export_dir": export_dir,
+        "pending_jobs": pending,
+    }
+
+
+@app.get("/api/export/{table}")
+def export_table(
+    table: str, format: str = "ndjson", gzip: bool = False, chunk_size: int = 5000
+):
+    """Stream a whole table as NDJSON or CSV (optionally gzip-encoded)"""
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail=f"Unknown export table: {table}")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
+
+    # Dedicated connection: the named cursor lives for the whole response
+    try:
+        export_db = DatabaseManager(get_settings().database_url)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    def generate():
+        try:
+            blocks = ENCODERS[format](
+                export_db.stream_table(table, chunk_size=max(1, chunk_size))
+            )
+            yield from gzip_stream(blocks) if gzip else blocks
+        finally:
+            export_db.close()
+
+    headers = {"Content-Disposition": f'attachment; filename="{table}.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        generate(), media_type=EXPORT_FORMATS[format], headers=headers
+    )
+
+
+# Maintenance endpoints
+def _run_compaction(older_than_days: int, batch_size: int):
+    """Background compaction on a dedicated connection"""
+    compaction_db = DatabaseManager(get_settings().database_url)
+    try:
+        summary = compaction_db.compact_history(
+            older_than_days=older_than_days, batch_size=batch_size
+        )
+        compaction_db.add_log(
+            f"History compaction removed {summary['deleted_rows']} rows "
+            f"in {summary['batches']} batches",
+            "info",
+        )
+    except Exception as e:
+        logger.error(f"History compaction failed: {e}")
+        compaction_db.add_log(f"History compaction failed: {e}", "error")
+    finally:
+        compaction_db.close()
+
+
+@app.post("/api/maintenance/compact")
+def compact_history(
+    request: CompactRequest,
+    background_tasks: BackgroundTasks,
+    db: DatabaseManager = Depends(get_db),
+):
+    """
+    Compact old resource history (dry run reports expected savings)
+    A sync route, so the estimate's COUNT runs in the threadpool.
+    """
+    try:
+        estimate = db.compact_history(
+            older_than_days=request.older_than_days,
+            batch_size=request.batch_size,
+            dry_run=True,
+        )
+    except Exception as e:
+        logger.error(f"Error estimating compaction: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if request.dry_run or not estimate["candidate_rows"]:
+        return {"success": True, "message": "Dry run", "compaction": estimate}
+
+    background_tasks.add_task(
+        _run_compaction, request.older_than_days, request.batch_size
+    )
+    return {"success": True, "message": "Compaction started", "compaction": estimate}
+
+
 # Error handlers
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
@@ -337,10 +1150,12 @@ if __name__ == "__main__":
 
     settings = get_settings()
 
+    # Reload mode only supports a single worker
     uvicorn.run(
         "app.api:app",
         host="0.0.0.0",
         port=5000,
         reload=settings.debug,
+        workers=1 if settings.debug else settings.api_workers,
         log_level="info",
     )
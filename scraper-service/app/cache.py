@@ -0,0 +1,126 @@
+"""
+Result Cache - Read-through cache for expensive API read paths
+Entries are evicted by job events delivered over Postgres LISTEN/NOTIFY
+(see events.listen_for_notifications)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+# Job event -> cache scopes it invalidates. "results" entries (catalog data)
+# only change when a job finishes; "jobs" entries (job list, statistics)
+# change whenever a job starts or finishes.
+EVENT_SCOPES = {
+    "started": ("jobs",),
+    "paused": ("jobs",),
+    "resumed": ("jobs",),
+    "stopping": ("jobs",),
+    "completed": ("jobs", "results"),
+    "failed": ("jobs", "results"),
+}
+
+# Key: (scope, name, *args); API keys include the data version the
+# request's ETag was built from
+CacheKey = Tuple[Hashable, ...]
+
+
+def _retrieve_exception(task: asyncio.Future):
+    """Mark a failed load retrieved so waiter-less failures are not logged"""
+    if not task.cancelled():
+        task.exception()
+
+
+class ResultCache:
+    """
+    In-process read-through cache with request coalescing
+
+    Concurrent misses for the same key share one loader call (singleflight).
+    The cache only serves entries while the invalidation listener is
+    connected; otherwise every call goes straight to the loader.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.enabled = False
+
+        self._entries: Dict[CacheKey, Tuple[float, Any]] = {}
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        # Bumped on every invalidation so loads that started earlier are
+        # returned to their callers but not stored
+        self._generation = 0
+
+    async def get(self, key: CacheKey, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, loading it in a worker thread on a miss"""
+        if not self.enabled:
+            return await run_in_threadpool(loader)
+
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        # The load runs in its own task so that a cancelled caller (e.g. a
+        # client disconnect) does not abandon the others waiting on it
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(key, loader))
+            pending.add_done_callback(_retrieve_exception)
+            self._inflight[key] = pending
+        return await asyncio.shield(pending)
+
+    async def _load(self, key: CacheKey, loader: Callable[[], Any]) -> Any:
+        """Run the loader in a worker thread and store its value if still current"""
+        generation = self._generation
+        try:
+            value = await run_in_threadpool(loader)
+        finally:
+            self._inflight.pop(key, None)
+        if self.enabled and generation == self._generation:
+            self._store(key, value)
+        return value
+
+    def _store(self, key: CacheKey, value: Any):
+        """Insert an entry, evicting the oldest ones when full"""
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, *scopes: str):
+        """Drop all entries in the given scopes (everything when none given)"""
+        self._generation += 1
+        if not scopes:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] in scopes]:
+            del self._entries[key]
+
+    def activate(self):
+        """Start serving entries (job event listener connected)"""
+        self.invalidate()
+        self.enabled = True
+
+    def deactivate(self):
+        """Stop serving entries; events may be missed while disconnected"""
+        self.enabled = False
+        self.invalidate()
+
+    def handle_event(self, payload: str):
+        """Evict the scopes affected by a job event notification"""
+        try:
+            event = json.loads(payload).get("event")
+        except (ValueError, AttributeError):
+            event = None
+        scopes = EVENT_SCOPES.get(event)
+        if scopes:
+            self.invalidate(*scopes)
+        else:
+            logger.warning(f"Unknown job event {payload!r}; clearing result cache")
+            self.invalidate()
@@ -2,18 +2,131 @@
 Database Manager - Handles all PostgreSQL operations
 """
 
+import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+import queue
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import extensions, sql
+from psycopg2.extras import Json, RealDictCursor, execute_values
+
+from .config import get_settings
 
 logger = logging.getLogger(__name__)
 
 ADELAIDE_TZ = ZoneInfo("Australia/Adelaide")
 
+# Tables range-partitioned by month (see ensure_monthly_partitions in schema.sql)
+PARTITIONED_TABLES = ("resource_history", "activity_log")
+
+# Columns exposed by the results API, mapped to vw_latest_results labels
+RESULT_FIELDS = {
+    "resource_id": "Resource ID",
+    "title": "Title",
+    "url": "URL",
+    "version": "Version",
+    "updated_date": "Updated Date",
+    "developer_id": "Developer ID",
+    "contributor": "Contributor",
+    "tagline": "Tagline",
+    "last_scraped_date": "Last Scraped",
+}
+
+# Job statuses that are already counted in scraper_stats
+FINISHED_STATUSES = ("completed", "failed")
+
+# NOTIFY channel for job lifecycle and control events (see app.cache,
+# app.events and app.job_control)
+JOB_EVENTS_CHANNEL = "scraper_job_events"
+
+# Control request -> (job event sent to the worker, resulting job status;
+# None keeps the status until the worker finishes the job)
+JOB_CONTROL_ACTIONS = {
+    "pause": ("paused", "paused"),
+    "resume": ("resumed", "running"),
+    "stop": ("stopping", None),
+}
+
+# Session advisory lock held by the scrape worker for the whole run, so two
+# scrapes never overlap; released automatically if the worker dies
+SCRAPE_LOCK_KEY = 827301955
+
+# Transaction-level advisory lock serialising job creation across API workers
+JOB_START_LOCK_KEY = 827301956
+
+# Session advisory lock held for a whole Parquet export (API or maintenance
+# CLI), so two exports never write the same job partitions at once
+EXPORT_LOCK_KEY = 827301957
+
+# Running/paused job with the worker's latest progress (None when idle)
+_ACTIVE_JOB_SQL = """
+    SELECT
+        j.id AS job_id,
+        j.status,
+        j.resources_found,
+        EXTRACT(EPOCH FROM (NOW() - j.job_start_time))::INTEGER AS elapsed_seconds,
+        p.current,
+        p.total,
+        p.current_item,
+        p.avg_item_ms,
+        p.updated_at AS progress_updated_at,
+        j.worker
+    FROM scrape_jobs j
+    LEFT JOIN scrape_progress p ON p.job_id = j.id
+    WHERE j.status IN ('running', 'paused')
+    ORDER BY j.job_start_time DESC
+    LIMIT 1
+"""
+
+# Scraper subprocess of the most recently started job
+_LATEST_WORKER_SQL = """
+    SELECT worker FROM scrape_jobs
+    WHERE worker IS NOT NULL
+    ORDER BY id DESC
+    LIMIT 1
+"""
+
+# Dashboard section -> scalar subquery returning its JSON (see get_dashboard)
+DASHBOARD_SECTIONS = {
+    "status": f"SELECT row_to_json(a) FROM ({_ACTIVE_JOB_SQL}) a",
+    "statistics": "SELECT row_to_json(s) FROM get_scraper_stats() s",
+    "jobs": """
+        SELECT COALESCE(json_agg(j), '[]')
+        FROM (SELECT * FROM vw_recent_jobs LIMIT %(jobs_limit)s) j
+    """,
+    "changes": "SELECT COALESCE(json_agg(c), '[]') FROM vw_latest_changes c",
+    "logs": """
+        SELECT COALESCE(json_agg(l), '[]')
+        FROM (
+            SELECT id, timestamp, level, message, job_id
+            FROM activity_log
+            ORDER BY timestamp DESC
+            LIMIT %(logs_limit)s
+        ) l
+    """,
+}
+
+# Stored columns besides version, title and updated_date; changes to these
+# alone are recorded with change_type 'metadata'
+METADATA_FIELDS = ("url", "developer_id", "tagline", "contributor")
+
+# Old 'unchanged' history rows that follow an earlier change row for the same
+# resource - redundant for snapshot reconstruction (alias: rh)
+_REDUNDANT_HISTORY = """
+    rh.change_type = 'unchanged'
+    AND rh.scraped_at < %(cutoff)s
+    AND EXISTS (
+        SELECT 1 FROM resource_history prev
+        WHERE prev.resource_id = rh.resource_id
+          AND prev.job_id < rh.job_id
+          AND prev.change_type <> 'unchanged'
+    )
+"""
+
 
 class DatabaseManager:
     """Manages all database operations"""
@@ -39,10 +152,126 @@ class DatabaseManager:
             self.conn.close()
             logger.info("Database connection closed")
 
-    def create_job(self, triggered_by: str = "manual") -> int:
-        """Create a new scrape job and return its ID"""
+    def _ensure_partitions(self, cur):
+        """Create current and upcoming monthly partitions (idempotent)"""
+        for table in PARTITIONED_TABLES:
+            cur.execute("SELECT ensure_monthly_partitions(%s)", (table,))
+
+    def _job_status_for_update(self, cur, job_id: int) -> Optional[str]:
+        """Lock a job row and return its current status"""
+        cur.execute(
+            "SELECT status FROM scrape_jobs WHERE id = %s FOR UPDATE", (job_id,)
+        )
+        row = cur.fetchone()
+        return row[0] if row else None
+
+    def _notify_job_event(self, cur, job_id: int, event: str):
+        """Queue a job event notification (delivered when the transaction commits)"""
+        cur.execute(
+            "SELECT pg_notify(%s, %s)",
+            (JOB_EVENTS_CHANNEL, json.dumps({"event": event, "job_id": job_id})),
+        )
+
+    def _record_job_stats(self, cur, job_id: int, outcome: str):
+        """Fold a job transition into scraper_stats and scraper_daily_stats"""
+        if outcome == "started":
+            cur.execute(
+                """
+                UPDATE scraper_stats
+                SET total_jobs = total_jobs + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE id = 1
+            """
+            )
+        elif outcome == "completed":
+            cur.execute(
+                """
+                UPDATE scraper_stats s
+                SET completed_jobs = s.completed_jobs + 1,
+                    last_scrape_time = GREATEST(s.last_scrape_time, j.job_start_time),
+                    total_resources_found = s.total_resources_found + j.resources_found,
+                    total_changes_detected = s.total_changes_detected + j.changes_detected,
+                    duration_p50_seconds = p.p50,
+                    duration_p95_seconds = p.p95,
+                    updated_at = CURRENT_TIMESTAMP
+                FROM scrape_jobs j,
+                     (
+                         SELECT
+                             percentile_cont(0.5) WITHIN GROUP (ORDER BY elapsed_seconds) AS p50,
+                             percentile_cont(0.95) WITHIN GROUP (ORDER BY elapsed_seconds) AS p95
+                         FROM scrape_jobs
+                         WHERE status = 'completed'
+                     ) p
+                WHERE s.id = 1 AND j.id = %s
+            """,
+                (job_id,),
+            )
+        else:
+            cur.execute(
+                """
+                UPDATE scraper_stats
+                SET failed_jobs = failed_jobs + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE id = 1
+            """
+            )
+
+        completed = outcome == "completed"
+        cur.execute(
+            """
+            INSERT INTO scraper_daily_stats (
+                day, jobs_started, jobs_completed, jobs_failed,
+                resources_found, changes_detected, total_elapsed_seconds
+            )
+            SELECT job_start_time::DATE, %s, %s, %s,
+                   CASE WHEN %s THEN COALESCE(resources_found, 0) ELSE 0 END,
+                   CASE WHEN %s THEN COALESCE(changes_detected, 0) ELSE 0 END,
+                   CASE WHEN %s THEN COALESCE(elapsed_seconds, 0) ELSE 0 END
+            FROM scrape_jobs
+            WHERE id = %s
+            ON CONFLICT (day) DO UPDATE SET
+                jobs_started = scraper_daily_stats.jobs_started + EXCLUDED.jobs_started,
+                jobs_completed = scraper_daily_stats.jobs_completed + EXCLUDED.jobs_completed,
+                jobs_failed = scraper_daily_stats.jobs_failed + EXCLUDED.jobs_failed,
+                resources_found = scraper_daily_stats.resources_found + EXCLUDED.resources_found,
+                changes_detected = scraper_daily_stats.changes_detected + EXCLUDED.changes_detected,
+                total_elapsed_seconds = scraper_daily_stats.total_elapsed_seconds
+                    + EXCLUDED.total_elapsed_seconds
+        """,
+            (
+                int(outcome == "started"),
+                int(completed),
+                int(outcome == "failed"),
+                completed,
+                completed,
+                completed,
+                job_id,
+            ),
+        )
+
+    def create_job(
+        self, triggered_by: str = "manual", only_if_idle: bool = False
+    ) -> Optional[int]:
+        """
+        Create a new scrape job and return its ID
+        With only_if_idle, returns None instead if a job is running or paused
+        (checked atomically, so concurrent API workers cannot both start one)
+        """
         try:
             with self.conn.cursor() as cur:
+                if only_if_idle:
+                    cur.execute(
+                        "SELECT pg_advisory_xact_lock(%s)", (JOB_START_LOCK_KEY,)
+                    )
+                    cur.execute(
+                        """
+                        SELECT 1 FROM scrape_jobs
+                        WHERE status IN ('running', 'paused')
+                        LIMIT 1
+                    """
+                    )
+                    if cur.fetchone():
+                        self.conn.rollback()
+                        return None
+                self._ensure_partitions(cur)
                 cur.execute(
                     """
                     INSERT INTO scrape_jobs (status, triggered_by, job_start_time)
@@ -52,6 +281,8 @@ class DatabaseManager:
                     (triggered_by, datetime.now(ADELAIDE_TZ)),
                 )
                 job_id = cur.fetchone()[0]
+                self._record_job_stats(cur, job_id, "started")
+                self._notify_job_event(cur, job_id, "started")
                 self.conn.commit()
                 logger.info(f"Created job #{job_id}")
                 return job_id
@@ -70,6 +301,7 @@ class DatabaseManager:
         """Mark job as completed"""
         try:
             with self.conn.cursor() as cur:
+                previous_status = self._job_status_for_update(cur, job_id)
                 cur.execute(
                     """
                     UPDATE scrape_jobs
@@ -88,6 +320,10 @@ class DatabaseManager:
                         job_id,
                     ),
                 )
+                if previous_status not in FINISHED_STATUSES:
+                    self._record_job_stats(cur, job_id, "completed")
+                cur.execute("DELETE FROM scrape_progress WHERE job_id = %s", (job_id,))
+                self._notify_job_event(cur, job_id, "completed")
                 self.conn.commit()
                 logger.info(
                     f"Job #{job_id} completed: {resources_found} resources, {changes_detected} changes"
@@ -101,6 +337,7 @@ class DatabaseManager:
         """Mark job as failed"""
         try:
             with self.conn.cursor() as cur:
+                previous_status = self._job_status_for_update(cur, job_id)
                 cur.execute(
                     """
                     UPDATE scrape_jobs
@@ -112,6 +349,10 @@ class DatabaseManager:
                 """,
                     (datetime.now(ADELAIDE_TZ), error_message, elapsed_seconds, job_id),
                 )
+                if previous_status not in FINISHED_STATUSES:
+                    self._record_job_stats(cur, job_id, "failed")
+                cur.execute("DELETE FROM scrape_progress WHERE job_id = %s", (job_id,))
+                self._notify_job_event(cur, job_id, "failed")
                 self.conn.commit()
                 logger.warning(f"Job #{job_id} failed: {error_message}")
         except Exception as e:
@@ -135,19 +376,65 @@ class DatabaseManager:
             self.conn.rollback()
             logger.error(f"Error adding log: {e}")
 
+    def add_logs(
+        self,
+        entries: Sequence[Tuple],
+        channel: Optional[str] = None,
+        payloads: Sequence[str] = (),
+    ):
+        """
+        Add a batch of activity log entries in one INSERT/COMMIT
+        Each entry is a (message, level, job_id, timestamp) tuple. Payloads
+        are NOTIFYed on channel in the same transaction.
+        """
+        if not entries:
+            return
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO activity_log (message, level, job_id, timestamp)
+                    VALUES %s
+                """,
+                    entries,
+                )
+                if channel and payloads:
+                    cur.execute(
+                        "SELECT pg_notify(%s, payload) FROM unnest(%s::TEXT[]) AS payload",
+                        (channel, list(payloads)),
+                    )
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
     def _parse_updated_date(self, updated_date):
-        """Parse updated_date string to datetime object"""
+        """
+        Parse updated_date string to datetime object
+        The offset is dropped, as the TIMESTAMP column does on insert, so the
+        result compares equal to the stored value.
+        """
         if updated_date and isinstance(updated_date, str):
             try:
-                return datetime.fromisoformat(updated_date.replace("Z", "+00:00"))
+                updated_date = datetime.fromisoformat(
+                    updated_date.replace("Z", "+00:00")
+                )
             except (ValueError, TypeError):
                 return None
+        if isinstance(updated_date, datetime):
+            return updated_date.replace(tzinfo=None)
         return updated_date
 
     def _detect_change_type(
         self, resource: Dict, previous_resources: Dict, updated_date
     ) -> str:
-        """Detect if resource is new, updated, or unchanged"""
+        """
+        Detect if resource is new, updated, metadata-only changed or unchanged
+        'updated' means a new version, title or updated date; a change to any
+        other stored column (or the date being cleared) is 'metadata', which
+        is recorded in history but not counted as a change.
+        """
         resource_id = resource.get("resource_id")
 
         if resource_id not in previous_resources:
@@ -165,16 +452,38 @@ class DatabaseManager:
         ):
             return "updated"
 
+        if updated_date != prev["updated_date"] or any(
+            resource.get(field) != prev[field] for field in METADATA_FIELDS
+        ):
+            return "metadata"
+
         return "unchanged"
 
-    def _upsert_resource(self, cur, resource: Dict, updated_date):
-        """Insert or update resource in main table"""
-        cur.execute(
+    def _resource_row(self, resource: Dict, updated_date) -> Tuple:
+        """Build the shared column tuple for resource and history inserts"""
+        return (
+            resource.get("resource_id"),
+            resource.get("url"),
+            resource.get("title"),
+            resource.get("developer_id"),
+            resource.get("version"),
+            updated_date,
+            resource.get("tagline"),
+            resource.get("contributor"),
+        )
+
+    def _upsert_resources(self, cur, rows: List[Tuple]):
+        """Insert or update resources in main table"""
+        if not rows:
+            return
+        now = datetime.now(ADELAIDE_TZ)
+        execute_values(
+            cur,
             """
             INSERT INTO exchange_resources (
                 resource_id, url, title, developer_id, version,
                 updated_date, tagline, contributor, last_scraped_date
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ) VALUES %s
             ON CONFLICT (resource_id) DO UPDATE SET
                 url = EXCLUDED.url,
                 title = EXCLUDED.title,
@@ -186,71 +495,92 @@ class DatabaseManager:
                 last_scraped_date = EXCLUDED.last_scraped_date,
                 is_deleted = FALSE
         """,
-            (
-                resource.get("resource_id"),
-                resource.get("url"),
-                resource.get("title"),
-                resource.get("developer_id"),
-                resource.get("version"),
-                updated_date,
-                resource.get("tagline"),
-                resource.get("contributor"),
-                datetime.now(ADELAIDE_TZ),
-            ),
+            [row + (now,) for row in rows],
         )
 
-    def _insert_resource_history(
-        self, cur, job_id: int, resource: Dict, updated_date, change_type: str
-    ):
-        """Insert resource into history table"""
+    def _close_history_ranges(self, cur, job_id: int, resource_ids: List[int]):
+        """End the validity range of the current rows superseded by this job"""
+        cur.execute(
+            """
+            UPDATE resource_history
+            SET valid_to_job = %s
+            WHERE resource_id = ANY(%s)
+              AND valid_to_job IS NULL
+              AND job_id < %s
+        """,
+            (job_id, resource_ids, job_id),
+        )
+
+    def _insert_resource_history(self, cur, job_id: int, rows: List[Tuple]):
+        """Insert (resource row, change_type) pairs into history table"""
+        if not rows:
+            return
+        self._close_history_ranges(cur, job_id, [row[0] for row, _ in rows])
+        now = datetime.now(ADELAIDE_TZ)
+        execute_values(
+            cur,
+            """
+            INSERT INTO resource_history (
+                resource_id, url, title, developer_id, version,
+                updated_date, tagline, contributor, job_id, scraped_at, change_type
+            ) VALUES %s
+        """,
+            [row + (job_id, now, change_type) for row, change_type in rows],
+        )
+
+    def _mark_deleted_resources(
+        self, cur, job_id: int, previous_resources: Dict, seen_ids: set
+    ) -> int:
+        """Mark unseen resources as deleted and record them in history"""
+        deleted_ids = [rid for rid in previous_resources if rid not in seen_ids]
+        if not deleted_ids:
+            return 0
+
+        cur.execute(
+            """
+            UPDATE exchange_resources
+            SET is_deleted = TRUE
+            WHERE resource_id = ANY(%s)
+        """,
+            (deleted_ids,),
+        )
+        # A 'deleted' row closes the resource's timeline so snapshots
+        # reconstructed from deltas stop including it
+        self._close_history_ranges(cur, job_id, deleted_ids)
         cur.execute(
             """
             INSERT INTO resource_history (
                 resource_id, job_id, url, title, developer_id, version,
                 updated_date, tagline, contributor, scraped_at, change_type
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            )
+            SELECT resource_id, %s, url, title, developer_id, version,
+                   updated_date, tagline, contributor, %s, 'deleted'
+            FROM exchange_resources
+            WHERE resource_id = ANY(%s)
         """,
-            (
-                resource.get("resource_id"),
-                job_id,
-                resource.get("url"),
-                resource.get("title"),
-                resource.get("developer_id"),
-                resource.get("version"),
-                updated_date,
-                resource.get("tagline"),
-                resource.get("contributor"),
-                datetime.now(ADELAIDE_TZ),
-                change_type,
-            ),
+            (job_id, datetime.now(ADELAIDE_TZ), deleted_ids),
         )
-
-    def _mark_deleted_resources(self, cur, previous_resources: Dict, seen_ids: set):
-        """Mark unseen resources as deleted"""
-        for resource_id in previous_resources.keys():
-            if resource_id not in seen_ids:
-                cur.execute(
-                    """
-                    UPDATE exchange_resources
-                    SET is_deleted = TRUE
-                    WHERE resource_id = %s
-                """,
-                    (resource_id,),
-                )
+        return len(deleted_ids)
 
     def store_scrape_results(self, job_id: int, results: List[Dict]) -> int:
         """
         Store scrape results and detect changes
         Returns number of changes detected
+
+        In 'delta' history mode only new, updated, metadata-only changed and
+        deleted resources are written to resource_history; 'full' mode also
+        records unchanged rows.
         """
         changes_detected = 0
+        delta_only = get_settings().history_mode.lower() == "delta"
 
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
                 # Get previous resources for comparison
                 cur.execute(
                     """
-                    SELECT resource_id, version, updated_date, title
+                    SELECT resource_id, url, title, developer_id, version,
+                           updated_date, tagline, contributor
                     FROM exchange_resources
                     WHERE is_deleted = FALSE
                 """
@@ -258,10 +588,12 @@ class DatabaseManager:
                 previous_resources = {row["resource_id"]: row for row in cur.fetchall()}
 
                 seen_resource_ids = set()
+                resource_rows = []
+                history_rows = []
 
                 for resource in results:
                     resource_id = resource.get("resource_id")
-                    if not resource_id:
+                    if not resource_id or resource_id in seen_resource_ids:
                         continue
 
                     seen_resource_ids.add(resource_id)
@@ -277,16 +609,32 @@ class DatabaseManager:
                     if change_type in ("new", "updated"):
                         changes_detected += 1
 
-                    self._upsert_resource(cur, resource, updated_date)
-                    self._insert_resource_history(
-                        cur, job_id, resource, updated_date, change_type
-                    )
+                    row = self._resource_row(resource, updated_date)
+                    resource_rows.append(row)
+                    if change_type != "unchanged" or not delta_only:
+                        history_rows.append((row, change_type))
+
+                self._upsert_resources(cur, resource_rows)
+                self._insert_resource_history(cur, job_id, history_rows)
+                deleted_count = self._mark_deleted_resources(
+                    cur, job_id, previous_resources, seen_resource_ids
+                )
 
-                self._mark_deleted_resources(cur, previous_resources, seen_resource_ids)
+                new_count = sum(1 for _, change in history_rows if change == "new")
+                cur.execute(
+                    """
+                    UPDATE scraper_stats
+                    SET total_resources = %s, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = 1
+                """,
+                    (len(previous_resources) + new_count - deleted_count,),
+                )
 
                 self.conn.commit()
                 logger.info(
-                    f"Stored {len(results)} resources, detected {changes_detected} changes"
+                    f"Stored {len(resource_rows)} resources, detected {changes_detected} "
+                    f"changes, {deleted_count} deleted "
+                    f"({len(history_rows) + deleted_count} history rows)"
                 )
                 return changes_detected
 
@@ -295,20 +643,370 @@ class DatabaseManager:
             logger.error(f"Error storing results: {e}")
             raise
 
-    def get_latest_results(self, limit: Optional[int] = None) -> List[Dict]:
-        """Get latest scrape results"""
+    @staticmethod
+    def _result_filters(
+        after, contributor, version, updated_from, updated_to, min_version, max_version
+    ) -> Tuple[List[sql.Composable], List]:
+        """WHERE conditions and parameters of get_latest_results"""
+        conditions = [sql.SQL("is_deleted = FALSE")]
+        params: List = []
+        for column, operator, value in (
+            ("resource_id", ">", after),
+            ("contributor", "=", contributor),
+            ("version", "=", version),
+            ("updated_date", ">=", updated_from),
+            ("updated_date", "<=", updated_to),
+        ):
+            if value is not None:
+                conditions.append(
+                    sql.SQL("{} {} %s").format(
+                        sql.Identifier(column), sql.SQL(operator)
+                    )
+                )
+                params.append(value)
+        for operator, value in ((">=", min_version), ("<=", max_version)):
+            if value is not None:
+                conditions.append(
+                    sql.SQL("version_key {} parse_version_key(%s)").format(
+                        sql.SQL(operator)
+                    )
+                )
+                params.append(value)
+        return conditions, params
+
+    def get_latest_results(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        contributor: Optional[str] = None,
+        version: Optional[str] = None,
+        updated_from: Optional[datetime] = None,
+        updated_to: Optional[datetime] = None,
+        min_version: Optional[str] = None,
+        max_version: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Get latest scrape results, keyset-paginated on resource_id
+
+        Args:
+            limit: Page size (all rows when omitted)
+            after: Only return resources with resource_id greater than this
+            fields: Column names to return (see RESULT_FIELDS); resource_id
+                is always included so the next cursor can be derived
+            contributor, version: Exact-match filters
+            updated_from, updated_to: Inclusive updated_date range
+            min_version, max_version: Inclusive numeric version range
+                (compared with parse_version_key, so 1.10 > 1.9)
+        """
+        selected = list(RESULT_FIELDS)
+        if fields:
+            unknown = [f for f in fields if f not in RESULT_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+            selected = ["resource_id"] + [f for f in fields if f != "resource_id"]
+
+        conditions, params = self._result_filters(
+            after,
+            contributor,
+            version,
+            updated_from,
+            updated_to,
+            min_version,
+            max_version,
+        )
+
+        query = sql.SQL(
+            "SELECT {columns} FROM exchange_resources WHERE {conditions} "
+            "ORDER BY resource_id"
+        ).format(
+            columns=sql.SQL(", ").join(
+                sql.SQL("{} AS {}").format(
+                    sql.Identifier(f), sql.Identifier(RESULT_FIELDS[f])
+                )
+                for f in selected
+            ),
+            conditions=sql.SQL(" AND ").join(conditions),
+        )
+        if limit is not None:
+            if limit < 1:
+                raise ValueError("limit must be at least 1")
+            query += sql.SQL(" LIMIT %s")
+            params.append(limit)
+
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-                query = "SELECT * FROM vw_latest_results"
-                if limit:
-                    query += f" LIMIT {limit}"
-
-                cur.execute(query)
+                cur.execute(query, params)
                 return [dict(row) for row in cur.fetchall()]
         except Exception as e:
             logger.error(f"Error fetching latest results: {e}")
             raise
 
+    def get_updated_since(
+        self, since_job: int, min_version: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Get resources whose version changed after a job
+
+        Compares each resource's latest new/updated row after since_job with
+        its state as of since_job; only version changes are reported, and
+        resources deleted since that row are left out. A resource that was
+        deleted as of since_job counts as added (no previous version).
+
+        Args:
+            since_job: Job id to compare against (exclusive)
+            min_version: Only include resources now at this version or higher
+        """
+        version_filter = ""
+        params: List = [since_job, since_job]
+        if min_version is not None:
+            # Applied to the latest row, not before picking it
+            version_filter = "AND cur.version_key >= parse_version_key(%s)"
+            params.append(min_version)
+
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    f"""
+                    SELECT
+                        cur.resource_id AS "Resource ID",
+                        cur.title AS "Title",
+                        cur.url AS "URL",
+                        CASE WHEN prev.change_type <> 'deleted'
+                             THEN prev.version END AS "Previous Version",
+                        cur.version AS "Version",
+                        cur.updated_date AS "Updated Date",
+                        cur.contributor AS "Contributor",
+                        cur.job_id AS "Changed In Job"
+                    FROM (
+                        SELECT DISTINCT ON (rh.resource_id) rh.*
+                        FROM resource_history rh
+                        WHERE rh.job_id > %s
+                          AND rh.change_type IN ('new', 'updated')
+                        ORDER BY rh.resource_id, rh.job_id DESC
+                    ) cur
+                    LEFT JOIN LATERAL (
+                        SELECT p.version, p.version_key, p.change_type
+                        FROM resource_history p
+                        WHERE p.resource_id = cur.resource_id
+                          AND p.job_id <= %s
+                        ORDER BY p.job_id DESC, p.id DESC
+                        LIMIT 1
+                    ) prev ON TRUE
+                    WHERE (prev.change_type IS NULL
+                           OR prev.change_type = 'deleted'
+                           OR prev.version_key IS DISTINCT FROM cur.version_key)
+                      AND NOT EXISTS (
+                          SELECT 1
+                          FROM resource_history d
+                          WHERE d.resource_id = cur.resource_id
+                            AND d.job_id > cur.job_id
+                            AND d.change_type = 'deleted'
+                      )
+                      {version_filter}
+                    ORDER BY cur.version_key DESC NULLS LAST, cur.resource_id
+                """,
+                    params,
+                )
+                return [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(
+                f"Error fetching resources updated since job #{since_job}: {e}"
+            )
+            raise
+
+    def search_resources(
+        self, query: str, limit: int = 25, offset: int = 0
+    ) -> Tuple[List[Dict], int]:
+        """
+        Ranked prefix full-text search over title, tagline and contributor
+        Returns (page of results, total number of matches)
+        """
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT
+                        resource_id AS "Resource ID",
+                        title AS "Title",
+                        url AS "URL",
+                        version AS "Version",
+                        updated_date AS "Updated Date",
+                        developer_id AS "Developer ID",
+                        contributor AS "Contributor",
+                        tagline AS "Tagline",
+                        rank AS "Rank",
+                        total_count
+                    FROM search_resources(%s, %s, %s)
+                """,
+                    (query, limit, offset),
+                )
+                rows = [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Error searching resources for {query!r}: {e}")
+            raise
+
+        total = rows[0]["total_count"] if rows else 0
+        for row in rows:
+            del row["total_count"]
+        return rows, total
+
+    def get_resource_history(self, resource_ids: Sequence[int]) -> List[Dict]:
+        """
+        Get the version/title/updated date timeline of several resources
+        Only rows where one of those changed are returned (see the
+        get_resource_history() SQL function), per resource oldest first.
+        """
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT
+                        resource_id AS "Resource ID",
+                        job_id AS "Job ID",
+                        scraped_at AS "Scraped At",
+                        change_type AS "Change Type",
+                        title AS "Title",
+                        version AS "Version",
+                        updated_date AS "Updated Date",
+                        previous_title AS "Previous Title",
+                        previous_version AS "Previous Version",
+                        previous_updated_date AS "Previous Updated Date"
+                    FROM get_resource_history(%s)
+                """,
+                    (list(resource_ids),),
+                )
+                return [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Error fetching resource history: {e}")
+            raise
+
+    def stream_table(
+        self, table: str, chunk_size: int = 5000
+    ) -> Iterator[Tuple[List[str], List[Tuple]]]:
+        """
+        Stream a whole table through a named server-side cursor
+        Yields (column names, rows) chunks so memory stays constant
+        """
+        try:
+            with self.conn.cursor(name=f"export_{table}") as cur:
+                cur.itersize = chunk_size
+                cur.execute(sql.SQL("SELECT * FROM {}").format(sql.Identifier(table)))
+                columns = None
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if columns is None:
+                        columns = [desc[0] for desc in cur.description]
+                    if not rows:
+                        break
+                    yield columns, rows
+        finally:
+            # Read-only transaction; ends the cursor either way
+            self.conn.rollback()
+
+    def get_finished_jobs(self) -> List[Dict]:
+        """Get all completed or failed jobs, oldest first"""
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT id, job_start_time, job_end_time, status, resources_found,
+                           changes_detected, error_message, elapsed_seconds, triggered_by
+                    FROM scrape_jobs
+                    WHERE status IN ('completed', 'failed')
+                    ORDER BY id
+                """
+                )
+                return [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Error fetching finished jobs: {e}")
+            raise
+
+    def get_job_history(self, job_id: int) -> List[Dict]:
+        """Get the resource_history rows written by one job"""
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT id, resource_id, url, title, developer_id, version,
+                           updated_date, tagline, contributor, scraped_at, change_type
+                    FROM resource_history
+                    WHERE job_id = %s
+                    ORDER BY resource_id
+                """,
+                    (job_id,),
+                )
+                return [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Error fetching history for job #{job_id}: {e}")
+            raise
+
+    def get_results_as_of(self, job_id: int) -> Optional[List[Dict]]:
+        """
+        Get the full catalog as it stood after a completed job
+        Returns None if the job does not exist or did not complete
+        """
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    "SELECT 1 FROM scrape_jobs WHERE id = %s AND status = 'completed'",
+                    (job_id,),
+                )
+                if not cur.fetchone():
+                    return None
+
+                cur.execute(
+                    """
+                    SELECT
+                        resource_id AS "Resource ID",
+                        title AS "Title",
+                        url AS "URL",
+                        version AS "Version",
+                        updated_date AS "Updated Date",
+                        developer_id AS "Developer ID",
+                        contributor AS "Contributor",
+                        tagline AS "Tagline",
+                        job_id AS "Changed In Job",
+                        scraped_at AS "Scraped At"
+                    FROM get_results_as_of(%s)
+                    ORDER BY resource_id
+                """,
+                    (job_id,),
+                )
+                return [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Error fetching results as of job #{job_id}: {e}")
+            raise
+
+    def get_job_diff(self, from_job: int, to_job: int) -> Optional[Dict]:
+        """
+        Get added, removed and changed resources between two completed jobs
+        Returns None if either job does not exist or did not complete
+        """
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT COUNT(*) AS n FROM scrape_jobs
+                    WHERE id IN (%s, %s) AND status = 'completed'
+                """,
+                    (from_job, to_job),
+                )
+                if cur.fetchone()["n"] != len({from_job, to_job}):
+                    return None
+
+                cur.execute(
+                    "SELECT resource_id, change, title, changes FROM diff_jobs(%s, %s)",
+                    (from_job, to_job),
+                )
+                diff = {"added": [], "removed": [], "changed": []}
+                for row in cur.fetchall():
+                    diff[row.pop("change")].append(dict(row))
+                return diff
+        except Exception as e:
+            logger.error(f"Error diffing jobs #{from_job} and #{to_job}: {e}")
+            raise
+
     def get_latest_changes(self) -> List[Dict]:
         """Get changes from most recent scrape"""
         try:
@@ -361,6 +1059,445 @@ class DatabaseManager:
             logger.error(f"Error clearing logs: {e}")
             raise
 
+    def _history_bytes_per_row(self, cur) -> float:
+        """Average on-disk bytes (heap + indexes) per resource_history row"""
+        cur.execute(
+            """
+            SELECT COALESCE(SUM(pg_total_relation_size(c.oid)), 0) AS total_bytes,
+                   COALESCE(SUM(GREATEST(c.reltuples, 0)), 0) AS est_rows
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'resource_history'::regclass
+        """
+        )
+        row = cur.fetchone()
+        total_bytes, est_rows = row["total_bytes"], row["est_rows"]
+        if not est_rows:
+            cur.execute("SELECT COUNT(*) AS n FROM resource_history")
+            est_rows = cur.fetchone()["n"]
+        return float(total_bytes) / float(est_rows) if est_rows else 0.0
+
+    def compact_history(
+        self, older_than_days: int = 90, batch_size: int = 5000, dry_run: bool = False
+    ) -> Dict:
+        """
+        Collapse old resource_history into a per-resource change timeline
+
+        Deletes 'unchanged' rows older than the cutoff that follow an earlier
+        change row for the same resource (they add nothing to as-of snapshots),
+        committing every batch to keep locks short, then runs VACUUM (ANALYZE)
+        on the partitions that were touched.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if older_than_days < 0:
+            raise ValueError("older_than_days must not be negative")
+
+        cutoff = datetime.now(ADELAIDE_TZ) - timedelta(days=older_than_days)
+        params = {"cutoff": cutoff, "batch_size": batch_size}
+        summary = {
+            "dry_run": dry_run,
+            "cutoff": cutoff.isoformat(),
+            "candidate_rows": 0,
+            "deleted_rows": 0,
+            "estimated_bytes_saved": 0,
+            "batches": 0,
+            "vacuumed": [],
+        }
+
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    f"SELECT COUNT(*) AS n FROM resource_history rh WHERE {_REDUNDANT_HISTORY}",
+                    params,
+                )
+                summary["candidate_rows"] = cur.fetchone()["n"]
+                summary["estimated_bytes_saved"] = int(
+                    summary["candidate_rows"] * self._history_bytes_per_row(cur)
+                )
+                self.conn.commit()
+
+                if dry_run or not summary["candidate_rows"]:
+                    return summary
+
+                touched = set()
+                while True:
+                    cur.execute(
+                        f"""
+                        WITH batch AS (
+                            SELECT rh.id, rh.scraped_at
+                            FROM resource_history rh
+                            WHERE {_REDUNDANT_HISTORY}
+                            LIMIT %(batch_size)s
+                        )
+                        DELETE FROM resource_history rh
+                        USING batch
+                        WHERE rh.id = batch.id AND rh.scraped_at = batch.scraped_at
+                        RETURNING rh.tableoid::regclass::text AS partition,
+                                  rh.resource_id
+                    """,
+                        params,
+                    )
+                    deleted = cur.fetchall()
+                    # Predecessor rows now stay valid until the next kept row
+                    cur.execute(
+                        "SELECT rebuild_history_validity(%s)",
+                        (list({row["resource_id"] for row in deleted}),),
+                    )
+                    self.conn.commit()
+
+                    summary["batches"] += 1
+                    summary["deleted_rows"] += len(deleted)
+                    touched.update(row["partition"] for row in deleted)
+                    if len(deleted) < batch_size:
+                        break
+
+            summary["vacuumed"] = sorted(touched)
+            self._vacuum_analyze(summary["vacuumed"])
+            logger.info(
+                f"Compacted resource_history: removed {summary['deleted_rows']} rows "
+                f"in {summary['batches']} batches"
+            )
+            return summary
+
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error compacting history: {e}")
+            raise
+
+    def _vacuum_analyze(self, tables: List[str]):
+        """Run VACUUM (ANALYZE) on each table (needs autocommit)"""
+        if not tables:
+            return
+        self.conn.autocommit = True
+        try:
+            with self.conn.cursor() as cur:
+                for table in tables:
+                    cur.execute(
+                        sql.SQL("VACUUM (ANALYZE) {}").format(sql.Identifier(table))
+                    )
+        finally:
+            self.conn.autocommit = False
+
+    def request_job_control(
+        self, action: str, job_id: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Record a pause/resume/stop request and notify the worker running the job
+
+        Targets job_id, or the most recent running/paused job when omitted.
+        Returns the job id, or None if there is no matching active job.
+        """
+        event, status = JOB_CONTROL_ACTIONS[action]
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    """
+                    UPDATE scrape_jobs
+                    SET control_action = %s,
+                        status = COALESCE(%s, status)
+                    WHERE id = (
+                        SELECT id FROM scrape_jobs
+                        WHERE status IN ('running', 'paused')
+                          AND (%s::INTEGER IS NULL OR id = %s)
+                        ORDER BY job_start_time DESC
+                        LIMIT 1
+                    )
+                    RETURNING id
+                """,
+                    (action, status, job_id, job_id),
+                )
+                row = cur.fetchone()
+                if row:
+                    self._notify_job_event(cur, row[0], event)
+                self.conn.commit()
+                return row[0] if row else None
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error requesting '{action}' for job: {e}")
+            raise
+
+    def acquire_scrape_lock(self) -> bool:
+        """
+        Take the scrape advisory lock for this connection (non-blocking)
+        Returns False if another worker already holds it
+        """
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT pg_try_advisory_lock(%s)", (SCRAPE_LOCK_KEY,))
+            acquired = cur.fetchone()[0]
+        self.conn.commit()
+        return acquired
+
+    def release_scrape_lock(self):
+        """Release the scrape advisory lock taken by acquire_scrape_lock()"""
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_unlock(%s)", (SCRAPE_LOCK_KEY,))
+        self.conn.commit()
+
+    @contextmanager
+    def export_lock(self) -> Iterator[None]:
+        """Hold the export advisory lock for the block, waiting for a running export"""
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_lock(%s)", (EXPORT_LOCK_KEY,))
+        self.conn.commit()
+        try:
+            yield
+        finally:
+            # A failed block may leave the transaction aborted
+            self.conn.rollback()
+            with self.conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_unlock(%s)", (EXPORT_LOCK_KEY,))
+            self.conn.commit()
+
+    def reap_stale_jobs(self, stale_after_seconds: int) -> List[Dict]:
+        """
+        Fail running/paused jobs whose worker has stopped sending heartbeats
+
+        Nothing is reaped while a worker holds the scrape lock, since that
+        worker is still alive. Returns the reaped jobs (id, triggered_by).
+        """
+        cutoff = datetime.now(ADELAIDE_TZ) - timedelta(seconds=stale_after_seconds)
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                # bigint advisory keys below 2^32 show up as classid 0, objid key
+                cur.execute(
+                    """
+                    SELECT EXISTS (
+                        SELECT 1 FROM pg_locks
+                        WHERE locktype = 'advisory'
+                          AND database = (
+                              SELECT oid FROM pg_database
+                              WHERE datname = current_database()
+                          )
+                          AND classid = 0 AND objid = %s AND objsubid = 1
+                    ) AS held
+                """,
+                    (SCRAPE_LOCK_KEY,),
+                )
+                if cur.fetchone()["held"]:
+                    self.conn.commit()
+                    return []
+
+                cur.execute(
+                    """
+                    UPDATE scrape_jobs
+                    SET status = 'failed',
+                        job_end_time = %s,
+                        error_message = 'Worker stopped responding (last heartbeat '
+                            || to_char(COALESCE(heartbeat_at, job_start_time),
+                                       'YYYY-MM-DD HH24:MI:SS')
+                            || ')',
+                        elapsed_seconds = EXTRACT(EPOCH FROM
+                            COALESCE(heartbeat_at, job_start_time) - job_start_time
+                        )::INTEGER
+                    WHERE status IN ('running', 'paused')
+                      AND COALESCE(heartbeat_at, job_start_time) < %s
+                    RETURNING id, triggered_by
+                """,
+                    (datetime.now(ADELAIDE_TZ), cutoff),
+                )
+                jobs = cur.fetchall()
+                for job in jobs:
+                    self._record_job_stats(cur, job["id"], "failed")
+                    cur.execute(
+                        "DELETE FROM scrape_progress WHERE job_id = %s", (job["id"],)
+                    )
+                    self._notify_job_event(cur, job["id"], "failed")
+                self.conn.commit()
+                for job in jobs:
+                    logger.warning(
+                        f"Job #{job['id']} failed: worker stopped responding"
+                    )
+                return jobs
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error reaping stale jobs: {e}")
+            raise
+
+    def update_worker_status(self, job_id: int, worker: Dict[str, Any]):
+        """Save the supervisor's view of a job's scraper subprocess"""
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE scrape_jobs SET worker = %s WHERE id = %s",
+                    (Json(worker), job_id),
+                )
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def get_latest_worker(self) -> Optional[Dict]:
+        """The scraper subprocess of the most recently started job, if recorded"""
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(_LATEST_WORKER_SQL)
+                row = cur.fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            logger.error(f"Error fetching worker status: {e}")
+            self.conn.rollback()
+            raise
+
+    def add_worker_output(self, entries: Sequence[Tuple], keep: int = 500):
+        """
+        Add a batch of scraper subprocess output lines
+        Each entry is a (line, stream, job_id, timestamp) tuple. Only the
+        newest job's last `keep` lines are retained.
+        """
+        if not entries:
+            return
+        job_id = entries[-1][2]
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO scrape_output (line, stream, job_id, timestamp)
+                    VALUES %s
+                """,
+                    entries,
+                )
+                cur.execute(
+                    """
+                    DELETE FROM scrape_output
+                    WHERE job_id <> %(job_id)s
+                       OR id <= (
+                           SELECT MAX(id) FROM scrape_output WHERE job_id = %(job_id)s
+                       ) - %(keep)s
+                """,
+                    {"job_id": job_id, "keep": keep},
+                )
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def get_worker_output(self, limit: int = 100) -> List[Dict]:
+        """Latest scraper subprocess output lines, oldest first"""
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT job_id, stream, line, timestamp
+                    FROM (
+                        SELECT * FROM scrape_output ORDER BY id DESC LIMIT %s
+                    ) latest
+                    ORDER BY id
+                """,
+                    (limit,),
+                )
+                return [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Error fetching worker output: {e}")
+            self.conn.rollback()
+            raise
+
+    def get_active_job_progress(self) -> Optional[Dict]:
+        """
+        Get the running/paused job with the worker's latest progress
+        Returns None when no job is active
+        """
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(_ACTIVE_JOB_SQL)
+                row = cur.fetchone()
+                return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"Error fetching active job progress: {e}")
+            self.conn.rollback()
+            raise
+
+    def get_dashboard(
+        self,
+        sections: Sequence[str] = tuple(DASHBOARD_SECTIONS),
+        jobs_limit: int = 10,
+        logs_limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        Get several dashboard sections in a single query
+        Keys are the requested DASHBOARD_SECTIONS; "status" also adds
+        "last_worker" for when no job is active.
+        """
+        unknown = set(sections) - set(DASHBOARD_SECTIONS)
+        if unknown:
+            raise ValueError(
+                f"Unknown dashboard sections: {', '.join(sorted(unknown))}"
+            )
+
+        columns = [
+            sql.SQL("({}) AS {}").format(
+                sql.SQL(DASHBOARD_SECTIONS[name]), sql.Identifier(name)
+            )
+            for name in sections
+        ]
+        if "status" in sections:
+            columns.append(
+                sql.SQL("({}) AS last_worker").format(sql.SQL(_LATEST_WORKER_SQL))
+            )
+
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    sql.SQL("SELECT {}").format(sql.SQL(", ").join(columns)),
+                    {"jobs_limit": jobs_limit, "logs_limit": logs_limit},
+                )
+                return dict(cur.fetchone())
+        except Exception as e:
+            logger.error(f"Error fetching dashboard: {e}")
+            self.conn.rollback()
+            raise
+
+    def get_data_version(self) -> Dict[str, str]:
+        """
+        Cheap validators for HTTP caching (PK/singleton lookups only)
+
+        results: latest finished job - catalog data only changes when a job ends
+        jobs: latest job's id/status/end time plus the scraper_stats timestamp
+        dashboard: jobs plus the live parts - the newest log line, the last
+            worker state and, while a job is active, the current second
+            (its progress and elapsed time change continuously)
+        """
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT
+                        (SELECT id || ':' || COALESCE(job_end_time::TEXT, '')
+                         FROM scrape_jobs
+                         WHERE status IN %s
+                         ORDER BY id DESC LIMIT 1) AS finished,
+                        (SELECT id || ':' || status || ':' || COALESCE(job_end_time::TEXT, '')
+                         FROM scrape_jobs
+                         ORDER BY id DESC LIMIT 1) AS latest,
+                        (SELECT updated_at::TEXT FROM scraper_stats WHERE id = 1) AS stats,
+                        (SELECT id || ':' || date_trunc('second', CURRENT_TIMESTAMP)::TEXT
+                         FROM scrape_jobs
+                         WHERE status IN ('running', 'paused')
+                         ORDER BY job_start_time DESC LIMIT 1) AS active,
+                        (SELECT md5(worker::TEXT)
+                         FROM scrape_jobs
+                         WHERE worker IS NOT NULL
+                         ORDER BY id DESC LIMIT 1) AS worker,
+                        (SELECT MAX(id)::TEXT FROM activity_log) AS logs
+                """,
+                    (FINISHED_STATUSES,),
+                )
+                row = cur.fetchone()
+        except Exception as e:
+            logger.error(f"Error fetching data version: {e}")
+            # Leave the shared connection usable for the request handler
+            self.conn.rollback()
+            raise
+
+        jobs = f"{row['latest'] or ''}|{row['stats'] or ''}"
+        live = (row["active"], row["worker"], row["logs"])
+        return {
+            "results": row["finished"] or "",
+            "jobs": jobs,
+            "dashboard": "|".join([jobs, *(value or "" for value in live)]),
+        }
+
     def get_statistics(self) -> Dict:
         """Get scraper statistics"""
         try:
@@ -371,3 +1508,77 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error fetching statistics: {e}")
             raise
+
+    def get_daily_statistics(self, days: int = 30) -> List[Dict]:
+        """Get per-day job rollups, most recent first"""
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    SELECT day, jobs_started, jobs_completed, jobs_failed,
+                           resources_found, changes_detected,
+                           CASE WHEN jobs_completed > 0
+                                THEN total_elapsed_seconds::NUMERIC / jobs_completed
+                           END AS avg_elapsed_seconds
+                    FROM scraper_daily_stats
+                    ORDER BY day DESC
+                    LIMIT %s
+                """,
+                    (days,),
+                )
+                return [dict(row) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Error fetching daily statistics: {e}")
+            raise
+
+
+class DatabasePool:
+    """
+    Pool of DatabaseManager connections for the API
+
+    Each request borrows its own manager, so concurrent requests (and cache
+    loads in worker threads) never share a connection or transaction. Up to
+    `size` idle connections are kept; when all are in use an extra one is
+    opened and closed on return rather than making the caller wait.
+    """
+
+    def __init__(self, database_url: str, size: int = 5):
+        self.database_url = database_url
+        self.size = max(1, size)
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+
+    @contextmanager
+    def connection(self) -> Iterator[DatabaseManager]:
+        """Borrow a DatabaseManager for the duration of the block"""
+        try:
+            db = self._idle.get_nowait()
+        except queue.Empty:
+            db = DatabaseManager(self.database_url)
+        try:
+            yield db
+        finally:
+            self._release(db)
+
+    def _release(self, db: DatabaseManager):
+        """Return a manager to the pool, ending any open transaction"""
+        if db.conn.closed:
+            return
+        try:
+            status = db.conn.get_transaction_status()
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                db.conn.rollback()
+        except Exception:
+            db.close()
+            return
+        if self._idle.qsize() < self.size:
+            self._idle.put(db)
+        else:
+            db.close()
+
+    def close(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
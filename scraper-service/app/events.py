@@ -0,0 +1,283 @@
+"""
+Events - Live scrape progress pushed from the worker to API clients
+The worker NOTIFYs progress and log lines; the API LISTENs and fans them
+out to Server-Sent Events subscribers
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set
+
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY channel for progress and log events from the scrape worker
+PROGRESS_EVENTS_CHANNEL = "scraper_progress"
+
+# NOTIFY payloads must stay under 8000 bytes
+MAX_MESSAGE_LENGTH = 1000
+
+# Save the job's progress row and notify listeners in one round trip
+PROGRESS_SQL = """
+    WITH saved AS (
+        INSERT INTO scrape_progress (
+            job_id, current, total, current_item, avg_item_ms, updated_at
+        )
+        VALUES (%(job_id)s, %(current)s, %(total)s, %(current_item)s,
+                %(avg_item_ms)s, CURRENT_TIMESTAMP)
+        ON CONFLICT (job_id) DO UPDATE SET
+            current = EXCLUDED.current,
+            total = EXCLUDED.total,
+            current_item = EXCLUDED.current_item,
+            avg_item_ms = EXCLUDED.avg_item_ms,
+            updated_at = EXCLUDED.updated_at
+        RETURNING job_id
+    )
+    SELECT pg_notify(%(channel)s, %(payload)s) FROM saved
+"""
+
+
+def log_event_payload(
+    message: str, level: str, job_id: Optional[int], timestamp: datetime
+) -> str:
+    """NOTIFY payload for an activity log line (sent by the LogWriter thread)"""
+    return json.dumps(
+        {
+            "type": "log",
+            "job_id": job_id,
+            "level": level,
+            "message": message[:MAX_MESSAGE_LENGTH],
+            "timestamp": timestamp.isoformat(),
+        }
+    )
+
+
+class EventPublisher:
+    """
+    Worker-side publisher of progress events
+
+    Progress is throttled to one event per min_interval (the last update of
+    a run is always sent) and also saved to the scrape_progress table, so
+    /api/scrape/status can read it without having received the event. Log
+    events are not sent from here but by the LogWriter thread, batched with
+    the activity_log INSERT, so logging never waits on a NOTIFY.
+    Publishing never raises: on a database error the event is dropped and
+    the connection re-opened on the next call.
+    """
+
+    def __init__(self, database_url: str, min_interval: float = 0.5):
+        self.database_url = database_url
+        self.min_interval = min_interval
+        self._conn = None
+        self._last_progress = 0.0
+
+    def _publish(self, event: Dict[str, Any], query: str = None, params: Dict = None):
+        """Send one event on the progress channel (optionally via a custom query)"""
+        payload = json.dumps(event, default=str)
+        try:
+            if self._conn is None:
+                self._conn = psycopg2.connect(self.database_url)
+                self._conn.autocommit = True
+            with self._conn.cursor() as cur:
+                if query:
+                    cur.execute(
+                        query,
+                        {
+                            **params,
+                            "channel": PROGRESS_EVENTS_CHANNEL,
+                            "payload": payload,
+                        },
+                    )
+                else:
+                    cur.execute(
+                        "SELECT pg_notify(%s, %s)", (PROGRESS_EVENTS_CHANNEL, payload)
+                    )
+        except Exception as e:
+            logger.warning(f"Dropped {event.get('type')} event: {e}")
+            self.close()
+
+    def progress(self, status: Dict[str, Any], force: bool = False):
+        """Publish a ScraperEngine.get_status() snapshot (throttled)"""
+        progress = status.get("progress", {})
+        total = progress.get("total", 0)
+        finished = total > 0 and progress.get("current") == total
+        now = time.monotonic()
+        if not (force or finished) and now - self._last_progress < self.min_interval:
+            return
+        self._last_progress = now
+
+        event = {"type": "progress", **status}
+        if status.get("job_id") is None:
+            self._publish(event)
+            return
+        self._publish(
+            event,
+            PROGRESS_SQL,
+            {
+                "job_id": status["job_id"],
+                "current": progress.get("current", 0),
+                "total": total,
+                "current_item": (progress.get("current_item") or "")[
+                    :MAX_MESSAGE_LENGTH
+                ],
+                "avg_item_ms": progress.get("avg_item_ms"),
+            },
+        )
+
+    def close(self):
+        """Close the publishing connection"""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+
+class EventBroadcaster:
+    """
+    API-side fan-out of events to any number of SSE subscribers
+
+    Each subscriber has a bounded queue; a client that falls behind loses
+    its oldest events rather than slowing everyone else down. The latest
+    progress snapshot is kept so new subscribers start with current state.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self.latest_progress: Optional[Dict[str, Any]] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: Dict[str, Any]):
+        """Deliver an event to every subscriber (event loop thread only)"""
+        if event.get("type") == "progress":
+            self.latest_progress = event
+        elif event.get("type") == "job" and event.get("event") in (
+            "completed",
+            "failed",
+        ):
+            self.latest_progress = None
+
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def handle_progress_notification(self, payload: str):
+        """NOTIFY handler for PROGRESS_EVENTS_CHANNEL"""
+        try:
+            self.publish(json.loads(payload))
+        except ValueError:
+            logger.warning(f"Ignoring malformed progress event {payload!r}")
+
+    def handle_job_notification(self, payload: str):
+        """NOTIFY handler for JOB_EVENTS_CHANNEL"""
+        try:
+            self.publish({"type": "job", **json.loads(payload)})
+        except (ValueError, TypeError):
+            logger.warning(f"Ignoring malformed job event {payload!r}")
+
+    async def subscribe(self, keepalive: float = 15.0) -> AsyncIterator[str]:
+        """Yield SSE-formatted frames until the client goes away"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            if self.latest_progress:
+                yield format_sse(self.latest_progress)
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    # Comment frame keeps proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            self._subscribers.discard(queue)
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """Encode an event as an SSE frame named after its type"""
+    data = json.dumps(event, default=str)
+    return f"event: {event.get('type', 'message')}\ndata: {data}\n\n"
+
+
+def _dispatch_notifications(conn, handlers: Dict[str, Callable[[str], None]]):
+    """Read pending notifications and hand each payload to its channel handler"""
+    conn.poll()
+    while conn.notifies:
+        notify = conn.notifies.pop(0)
+        handler = handlers.get(notify.channel)
+        if not handler:
+            continue
+        try:
+            handler(notify.payload)
+        except Exception as e:
+            logger.error(f"Error handling {notify.channel} event: {e}")
+
+
+async def listen_for_notifications(
+    database_url: str,
+    handlers: Dict[str, Callable[[str], None]],
+    on_connect: Optional[Callable[[], None]] = None,
+    on_disconnect: Optional[Callable[[], None]] = None,
+    retry_interval: float = 5.0,
+):
+    """
+    LISTEN on several channels over one connection until cancelled
+
+    Runs on the event loop using the connection's socket as a reader and
+    calls handlers[channel](payload) for every notification. on_connect
+    runs after each successful LISTEN, on_disconnect whenever the
+    connection is lost (and on cancellation); reconnects every
+    retry_interval seconds.
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        conn = None
+        fileno = None
+        try:
+            conn = psycopg2.connect(database_url)
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                for channel in handlers:
+                    cur.execute(f"LISTEN {channel}")
+
+            readable = asyncio.Event()
+            fileno = conn.fileno()
+            loop.add_reader(fileno, readable.set)
+
+            if on_connect:
+                on_connect()
+            logger.info(f"Listening for notifications on {', '.join(handlers)}")
+
+            while True:
+                await readable.wait()
+                readable.clear()
+                _dispatch_notifications(conn, handlers)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"Notification listener disconnected ({e}); "
+                f"retrying in {retry_interval:.0f}s"
+            )
+        finally:
+            if on_disconnect:
+                on_disconnect()
+            if fileno is not None:
+                loop.remove_reader(fileno)
+            if conn is not None:
+                conn.close()
+
+        await asyncio.sleep(retry_interval)
@@ -0,0 +1,200 @@
+"""
+Exporters - Encode streamed table chunks for bulk download
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import uuid
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Tables that may be exported in bulk
+EXPORT_TABLES = ("resource_history", "exchange_resources", "activity_log")
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# A chunk as produced by DatabaseManager.stream_table: (column names, rows)
+Chunk = Tuple[List[str], Sequence[Tuple]]
+
+
+def _json_default(value):
+    """Serialize values the json module does not handle natively"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def encode_ndjson(chunks: Iterable[Chunk]) -> Iterator[bytes]:
+    """One JSON object per row, one output block per chunk"""
+    for columns, rows in chunks:
+        yield "".join(
+            json.dumps(dict(zip(columns, row)), default=_json_default) + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+def _csv_value(value):
+    """Dates as ISO 8601, arrays (e.g. version_key) as Postgres literals"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, list):
+        return "{" + ",".join(str(v) for v in value) + "}"
+    return value
+
+
+def encode_csv(chunks: Iterable[Chunk]) -> Iterator[bytes]:
+    """CSV with a header row taken from the first chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header_written = False
+
+    for columns, rows in chunks:
+        if not header_written:
+            writer.writerow(columns)
+            header_written = True
+        for row in rows:
+            writer.writerow([_csv_value(v) for v in row])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def gzip_stream(blocks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip-compress a byte stream incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for block in blocks:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+ENCODERS = {
+    "ndjson": encode_ndjson,
+    "csv": encode_csv,
+}
+
+
+# Parquet snapshot export - one hive-style job_id=N partition per job, so
+# readers can prune by job (e.g. pyarrow.dataset with partitioning="hive")
+PARQUET_TABLES = ("scrape_jobs", "resource_history")
+
+
+def _parquet_schemas():
+    """Explicit schemas keep column types stable across job partitions"""
+    import pyarrow as pa
+
+    return {
+        "resource_history": pa.schema(
+            [
+                ("id", pa.int64()),
+                ("resource_id", pa.int32()),
+                ("url", pa.string()),
+                ("title", pa.string()),
+                ("developer_id", pa.string()),
+                ("version", pa.string()),
+                ("updated_date", pa.timestamp("us")),
+                ("tagline", pa.string()),
+                ("contributor", pa.string()),
+                ("scraped_at", pa.timestamp("us")),
+                ("change_type", pa.string()),
+            ]
+        ),
+        "scrape_jobs": pa.schema(
+            [
+                ("job_start_time", pa.timestamp("us")),
+                ("job_end_time", pa.timestamp("us")),
+                ("status", pa.string()),
+                ("resources_found", pa.int32()),
+                ("changes_detected", pa.int32()),
+                ("error_message", pa.string()),
+                ("elapsed_seconds", pa.int32()),
+                ("triggered_by", pa.string()),
+            ]
+        ),
+    }
+
+
+def exported_job_ids(export_dir: str) -> Set[int]:
+    """Jobs already exported (the scrape_jobs partition is written last)"""
+    jobs_dir = Path(export_dir) / "scrape_jobs"
+    if not jobs_dir.is_dir():
+        return set()
+    return {
+        int(entry.name.split("=", 1)[1])
+        for entry in jobs_dir.iterdir()
+        if entry.name.startswith("job_id=") and (entry / "part-0.parquet").exists()
+    }
+
+
+def _write_partition(pq, table, export_dir: str, name: str, job_id: int):
+    """Write one job partition atomically (uniquely named temp file + rename)"""
+    part_dir = Path(export_dir) / name / f"job_id={job_id}"
+    part_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = part_dir / f"part-0.parquet.{uuid.uuid4().hex}.tmp"
+    try:
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, part_dir / "part-0.parquet")
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def export_parquet(db_manager, export_dir: str) -> Dict:
+    """
+    Append finished jobs not yet exported to a Parquet dataset
+
+    Layout: <export_dir>/<table>/job_id=<N>/part-0.parquet
+    Runs under the database's export lock; an export started while another
+    is running waits for it, then only writes the jobs still missing.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("Parquet export requires the pyarrow package") from e
+
+    schemas = _parquet_schemas()
+    summary = {"export_dir": export_dir, "exported_jobs": [], "history_rows": 0}
+    with db_manager.export_lock():
+        done = exported_job_ids(export_dir)
+        jobs = [job for job in db_manager.get_finished_jobs() if job["id"] not in done]
+
+        for job in jobs:
+            job_id = job["id"]
+            history = db_manager.get_job_history(job_id)
+            _write_partition(
+                pq,
+                pa.Table.from_pylist(history, schema=schemas["resource_history"]),
+                export_dir,
+                "resource_history",
+                job_id,
+            )
+            _write_partition(
+                pq,
+                pa.Table.from_pylist([job], schema=schemas["scrape_jobs"]),
+                export_dir,
+                "scrape_jobs",
+                job_id,
+            )
+            summary["exported_jobs"].append(job_id)
+            summary["history_rows"] += len(history)
+
+    logger.info(
+        f"Parquet export: {len(summary['exported_jobs'])} new jobs, "
+        f"{summary['history_rows']} history rows"
+    )
+    return summary
@@ -0,0 +1,136 @@
+"""
+Job Control - Delivers pause/resume/stop requests to the scrape worker
+The API records the request on the job row and NOTIFYs JOB_EVENTS_CHANNEL;
+this listener thread runs inside the worker process and applies it to the
+ScraperEngine doing the scrape. It also writes the job's heartbeat, which
+the API's stale-job reaper watches.
+"""
+
+import json
+import logging
+import select
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+import psycopg2
+
+from .database import ADELAIDE_TZ, JOB_CONTROL_ACTIONS, JOB_EVENTS_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+# Job event -> control action
+CONTROL_EVENTS = {event: action for action, (event, _) in JOB_CONTROL_ACTIONS.items()}
+
+
+class JobControlListener:
+    """
+    Background thread applying control requests for one job to an engine
+    and recording the job's heartbeat every heartbeat_interval seconds
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        job_id: int,
+        engine,
+        poll_timeout: float = 5.0,
+        retry_interval: float = 5.0,
+        heartbeat_interval: float = 15.0,
+    ):
+        self.database_url = database_url
+        self.job_id = job_id
+        self.engine = engine
+        self.poll_timeout = poll_timeout
+        self.retry_interval = retry_interval
+        self.heartbeat_interval = heartbeat_interval
+        self._last_heartbeat = 0.0
+
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start listening in a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"job-control-{self.job_id}", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, timeout: float = 5.0):
+        """Stop listening"""
+        self._closed.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def apply(self, action: Optional[str]):
+        """Apply a control action to the engine"""
+        if action == "pause" and not self.engine.is_paused:
+            self.engine.pause()
+        elif action == "resume" and self.engine.is_paused:
+            self.engine.resume()
+        elif action == "stop" and not self.engine.should_stop:
+            self.engine.stop()
+
+    def _heartbeat(self, conn):
+        """Record that the worker is alive (at most every heartbeat_interval)"""
+        now = time.monotonic()
+        if now - self._last_heartbeat < self.heartbeat_interval:
+            return
+        with conn.cursor() as cur:
+            cur.execute(
+                "UPDATE scrape_jobs SET heartbeat_at = %s WHERE id = %s",
+                (datetime.now(ADELAIDE_TZ), self.job_id),
+            )
+        self._last_heartbeat = now
+
+    def _handle(self, payload: str):
+        """Apply a job event if it is a control request for our job"""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            return
+        if event.get("job_id") == self.job_id:
+            self.apply(CONTROL_EVENTS.get(event.get("event")))
+
+    def _listen(self, conn):
+        """LISTEN, catch up on the recorded request, then wait for events"""
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {JOB_EVENTS_CHANNEL}")
+            # Requests made before we were listening (or while reconnecting)
+            cur.execute(
+                "SELECT control_action FROM scrape_jobs WHERE id = %s", (self.job_id,)
+            )
+            row = cur.fetchone()
+        if row:
+            self.apply(row[0])
+
+        while not self._closed.is_set():
+            self._heartbeat(conn)
+            # Wake up periodically to notice close() and send heartbeats
+            if select.select([conn], [], [], self.poll_timeout) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                self._handle(conn.notifies.pop(0).payload)
+
+    def _run(self):
+        """Listener loop with reconnects"""
+        while not self._closed.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(self.database_url)
+                conn.autocommit = True
+                self._listen(conn)
+            except Exception as e:
+                logger.warning(
+                    f"Job control listener disconnected ({e}); "
+                    f"retrying in {self.retry_interval:.0f}s"
+                )
+                self._closed.wait(self.retry_interval)
+            finally:
+                if conn is not None:
+                    conn.close()
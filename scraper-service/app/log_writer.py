@@ -0,0 +1,147 @@
+"""
+Log Writer - Buffers activity log entries and writes them in batches
+Keeps per-message INSERT/COMMIT round-trips off the scrape's critical path
+"""
+
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from .database import ADELAIDE_TZ, DatabaseManager
+from .events import PROGRESS_EVENTS_CHANNEL, log_event_payload
+
+logger = logging.getLogger(__name__)
+
+# Severity ordering used for the database sink's minimum level
+LOG_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+# Queue marker telling the writer thread to drain and exit
+_SHUTDOWN = object()
+
+
+class LogWriter:
+    """
+    Background thread that batches activity log entries into the database
+
+    With publish_events, each batch is also NOTIFYed to live subscribers
+    (/api/scrape/events) in the same round-trip as its INSERT.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        flush_interval: float = 2.0,
+        batch_size: int = 100,
+        min_level: str = "info",
+        publish_events: bool = False,
+    ):
+        self.database_url = database_url
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self.min_level = LOG_LEVELS.get(min_level.lower(), LOG_LEVELS["info"])
+        self.publish_events = publish_events
+
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._db: Optional[DatabaseManager] = None
+
+    def start(self):
+        """Start the background writer thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="activity-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message: str, level: str = "info", job_id: Optional[int] = None):
+        """Queue a log entry (dropped if below the configured minimum level)"""
+        if LOG_LEVELS.get(level, LOG_LEVELS["info"]) < self.min_level:
+            return
+        self._queue.put((message, level, job_id, datetime.now(ADELAIDE_TZ)))
+
+    def close(self, timeout: float = 10.0):
+        """Flush all pending entries and stop the writer thread"""
+        if not self._thread:
+            return
+        self._queue.put(_SHUTDOWN)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Log writer did not drain within %.1fs", timeout)
+        self._thread = None
+
+    def _collect_batch(self) -> Tuple[List[Tuple], bool]:
+        """Block until a batch is full, the flush interval elapses or shutdown"""
+        batch: List[Tuple] = []
+        first = self._queue.get()
+        if first is _SHUTDOWN:
+            return batch, True
+        batch.append(first)
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _SHUTDOWN:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _write_batch(self, batch: List[Tuple]):
+        """Insert one batch (subclasses may write elsewhere)"""
+        if not self.publish_events:
+            self._db.add_logs(batch)
+            return
+        payloads = [
+            log_event_payload(message, level, job_id, ts)
+            for message, level, job_id, ts in batch
+            if job_id is not None
+        ]
+        self._db.add_logs(batch, PROGRESS_EVENTS_CHANNEL, payloads)
+
+    def _flush(self, batch: List[Tuple]):
+        """Write a batch in a single round-trip, dropping it on failure"""
+        if not batch:
+            return
+        try:
+            if self._db is None:
+                self._db = DatabaseManager(self.database_url)
+            self._write_batch(batch)
+        except Exception as e:
+            logger.error(f"Dropped {len(batch)} log entries: {e}")
+            if self._db:
+                self._db.close()
+            self._db = None
+
+    def _run(self):
+        """Writer loop - flush batches until shutdown, then drain the queue"""
+        try:
+            while True:
+                batch, shutdown = self._collect_batch()
+                self._flush(batch)
+                if shutdown:
+                    break
+
+            # Anything queued after the shutdown marker still gets written
+            remaining = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not _SHUTDOWN:
+                    remaining.append(item)
+            for start in range(0, len(remaining), self.batch_size):
+                self._flush(remaining[start : start + self.batch_size])
+        finally:
+            if self._db:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,120 @@
+"""
+Metrics - Prometheus instrumentation for the API and the scrape worker
+prometheus_client runs in multiprocess mode: every process (each uvicorn
+worker and the cli.py scrape subprocess) writes its samples to files in
+settings.metrics_dir and /metrics aggregates them, so per-phase scrape
+timings show up on the API although the scrape runs in another process.
+Without prometheus_client, or with metrics disabled, recording is a no-op.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
+from .config import get_settings
+
+_settings = get_settings()
+if _settings.metrics_enabled:
+    # Must be set before prometheus_client is imported; inherited by the
+    # scrape subprocess
+    os.makedirs(_settings.metrics_dir, exist_ok=True)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = _settings.metrics_dir
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # no metrics
+    prometheus_client = None
+
+METRICS_ENABLED = prometheus_client is not None and _settings.metrics_enabled
+
+# Scrape phases timed by track_phase()
+SCRAPE_PHASES = (
+    "navigation",  # page.goto
+    "page_content",  # page.content()
+    "parse",  # BeautifulSoup
+    "extract",  # CSS selector field extraction
+    "json_fallback",  # fields from captured JSON responses
+    "db_flush",  # storing the job's results
+    "load_more",  # one Load more click
+    "modal",  # closing modal popups
+)
+
+# Page loads take seconds, parsing and extraction milliseconds
+PHASE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+if METRICS_ENABLED:
+    PHASE_SECONDS = prometheus_client.Histogram(
+        "scraper_phase_seconds",
+        "Time spent in each scrape phase",
+        ["phase"],
+        buckets=PHASE_BUCKETS,
+    )
+    RESOURCES_SCRAPED = prometheus_client.Counter(
+        "scraper_resources_scraped", "Resources scraped successfully"
+    )
+    FAILURES = prometheus_client.Counter(
+        "scraper_failures", "Scrape failures by stage", ["stage"]
+    )
+    RETRIES = prometheus_client.Counter(
+        "scraper_retries", "Scrape actions retried by stage", ["stage"]
+    )
+    BYTES_TRANSFERRED = prometheus_client.Counter(
+        "scraper_bytes_transferred",
+        "Bytes of HTML and JSON received from the Exchange",
+        ["kind"],
+    )
+    REQUEST_SECONDS = prometheus_client.Histogram(
+        "api_request_duration_seconds",
+        "API request latency by route",
+        ["method", "route", "status"],
+    )
+
+
+@contextmanager
+def track_phase(phase: str) -> Iterator[None]:
+    """Time the enclosed block as one observation of a scrape phase"""
+    if not METRICS_ENABLED:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASE_SECONDS.labels(phase).observe(time.perf_counter() - started)
+
+
+def record_resource():
+    if METRICS_ENABLED:
+        RESOURCES_SCRAPED.inc()
+
+
+def record_failure(stage: str):
+    if METRICS_ENABLED:
+        FAILURES.labels(stage).inc()
+
+
+def record_retry(stage: str):
+    if METRICS_ENABLED:
+        RETRIES.labels(stage).inc()
+
+
+def record_bytes(kind: str, size: int):
+    if METRICS_ENABLED:
+        BYTES_TRANSFERRED.labels(kind).inc(size)
+
+
+def record_request(method: str, route: str, status: int, seconds: float):
+    if METRICS_ENABLED:
+        REQUEST_SECONDS.labels(method, route, str(status)).observe(seconds)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """All processes' metrics in the Prometheus text format"""
+    registry = prometheus_client.CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return (
+        prometheus_client.generate_latest(registry),
+        prometheus_client.CONTENT_TYPE_LATEST,
+    )
@@ -0,0 +1,118 @@
+"""
+Responses - orjson serialisation and negotiated compression for API payloads
+"""
+
+import gzip
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Content codings we can produce, in server preference order
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {}
+if brotli is not None:
+    COMPRESSORS["br"] = lambda data: brotli.compress(data, quality=5)
+COMPRESSORS["gzip"] = lambda data: gzip.compress(data, compresslevel=6)
+
+
+def _default(value):
+    """Types orjson does not serialise natively (matches jsonable_encoder)"""
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialise to JSON bytes with orjson"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered with orjson"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class PreparedBody:
+    """
+    A JSON body encoded once, with compressed variants built on first use
+    Cached by the API so unchanged results skip serialisation entirely. Safe
+    to share between threads; at worst a variant is compressed twice.
+    """
+
+    def __init__(self, content: Any):
+        self.raw = dumps(content)
+        self._variants: Dict[str, bytes] = {}
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """Body for a content coding (None = identity)"""
+        if encoding is None:
+            return self.raw
+        body = self._variants.get(encoding)
+        if body is None:
+            body = COMPRESSORS[encoding](self.raw)
+            self._variants[encoding] = body
+        return body
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the coding the client prefers among those we support, or None"""
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    # Highest client q-value wins; ties go to the server's order
+    best, best_quality = None, 0.0
+    for coding in COMPRESSORS:
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def json_response(
+    request: Request, content: Any, min_size: int = 1024, status_code: int = 200
+) -> Response:
+    """
+    JSON response compressed with br/gzip when the client accepts it and the
+    body is at least min_size bytes. Pass a PreparedBody to reuse its
+    encodings; anything else is serialised here, bypassing jsonable_encoder.
+    """
+    body = content if isinstance(content, PreparedBody) else PreparedBody(content)
+
+    encoding = None
+    if len(body.raw) >= min_size:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(
+        content=body.encoded(encoding),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -6,6 +6,7 @@ Handles all web scraping using Playwright + BeautifulSoup
 import json
 import logging
 import re
+import threading
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
@@ -15,6 +16,13 @@ from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 
 from .config import get_settings
+from .metrics import (
+    record_bytes,
+    record_failure,
+    record_resource,
+    record_retry,
+    track_phase,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +40,12 @@ USER_AGENT = (
 class ScraperEngine:
     """Main scraper engine with database integration"""
 
-    def __init__(self, db_manager, headless=True):
+    def __init__(
+        self, db_manager, headless=True, log_writer=None, event_publisher=None
+    ):
         self.db_manager = db_manager
+        self.log_writer = log_writer
+        self.event_publisher = event_publisher
         self.settings = get_settings()
         self.headless = headless
 
@@ -42,6 +54,9 @@ class ScraperEngine:
         self.should_stop = False
         self.is_paused = False
         self._is_running = False
+        # Set while the scrape may proceed; cleared by pause()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
 
         # Progress tracking
         self.start_time = None
@@ -50,7 +65,11 @@ class ScraperEngine:
             "total": 0,
             "current_item": "",
             "percentage": 0,
+            "avg_item_ms": None,
         }
+        # Moving average of seconds per scraped resource (drives the ETA)
+        self._avg_item_seconds = None
+        self._last_progress_time = None
 
     def is_running(self) -> bool:
         """Check if scraper is currently running"""
@@ -65,19 +84,42 @@ class ScraperEngine:
         elif level == "error":
             logger.error(message)
 
-        # Store in database
-        if self.db_manager and self.current_job_id:
+        # Store in database (batched through the log writer when available,
+        # which also pushes the line to live subscribers)
+        if self.log_writer and self.current_job_id:
+            self.log_writer.write(message, level, self.current_job_id)
+        elif self.db_manager and self.current_job_id:
             self.db_manager.add_log(message, level, self.current_job_id)
 
     def update_progress(self, current: int, total: int, current_item: str = ""):
         """Update progress tracking"""
+        now = time.monotonic()
+        previous = self.current_progress["current"]
+        if current == 0:
+            self._avg_item_seconds = None
+        elif self._last_progress_time is not None and current > previous:
+            latency = (now - self._last_progress_time) / (current - previous)
+            self._avg_item_seconds = (
+                latency
+                if self._avg_item_seconds is None
+                else 0.8 * self._avg_item_seconds + 0.2 * latency
+            )
+        self._last_progress_time = now
+
         percentage = int((current / total * 100)) if total > 0 else 0
         self.current_progress = {
             "current": current,
             "total": total,
             "current_item": current_item,
             "percentage": percentage,
+            "avg_item_ms": (
+                int(self._avg_item_seconds * 1000)
+                if self._avg_item_seconds is not None
+                else None
+            ),
         }
+        if self.event_publisher:
+            self.event_publisher.progress(self.get_status())
 
     def get_status(self) -> Dict:
         """Get current scraper status"""
@@ -96,12 +138,14 @@ class ScraperEngine:
                 (datetime.now(ADELAIDE_TZ) - self.start_time).total_seconds()
             )
 
-            # Estimate remaining time
+            # Estimate remaining time from recent per-item latency
             if (
                 self.current_progress["total"] > 0
                 and self.current_progress["current"] > 0
             ):
-                avg_time_per_item = elapsed_seconds / self.current_progress["current"]
+                avg_time_per_item = self._avg_item_seconds or (
+                    elapsed_seconds / self.current_progress["current"]
+                )
                 remaining_items = (
                     self.current_progress["total"] - self.current_progress["current"]
                 )
@@ -116,24 +160,28 @@ class ScraperEngine:
         }
 
     def stop(self):
-        """Signal scraper to stop"""
+        """Signal scraper to stop (also releases a paused scrape)"""
         self.should_stop = True
+        self._resume_event.set()
         self.log("Stop requested", "warning")
 
     def pause(self):
         """Pause scraper"""
         self.is_paused = True
+        self._resume_event.clear()
         self.log("Paused", "warning")
 
     def resume(self):
         """Resume scraper"""
         self.is_paused = False
+        # Time spent paused is not per-item latency (it would spike the ETA)
+        self._last_progress_time = time.monotonic()
+        self._resume_event.set()
         self.log("Resumed", "info")
 
     def check_pause_stop(self) -> bool:
-        """Check if we should pause or stop"""
-        while self.is_paused and not self.should_stop:
-            time.sleep(1)
+        """Block while paused; return True if the scrape should stop"""
+        self._resume_event.wait()
         return self.should_stop
 
     def _parse_9_digit_version(self, version_num: str) -> str:
@@ -295,15 +343,12 @@ class ScraperEngine:
                         or "/resources" in url.lower()
                     ):
                         try:
-                            j = resp.json()
+                            body = resp.body()
+                            record_bytes("json", len(body))
+                            j = json.loads(body)
                             json_matches.append({"url": url, "json": j})
                         except Exception:
-                            try:
-                                txt = resp.text()
-                                j = json.loads(txt)
-                                json_matches.append({"url": url, "json": j})
-                            except Exception:
-                                pass
+                            pass
             except Exception:
                 pass
 
@@ -426,16 +471,47 @@ class ScraperEngine:
         self._setup_json_capture(page, json_matches)
 
         try:
-            page.goto(resource_url, wait_until="networkidle")
+            with track_phase("navigation"):
+                page.goto(resource_url, wait_until="networkidle")
         except Exception as e:
+            record_failure("navigation")
             self.log(f"   Navigation warning: {e}", "warning")
 
         time.sleep(1.2)
 
-        html = page.content()
-        soup = BeautifulSoup(html, "lxml")
+        with track_phase("page_content"):
+            html = page.content()
+        record_bytes("html", len(html.encode("utf-8")))
+        with track_phase("parse"):
+            soup = BeautifulSoup(html, "lxml")
+
+        with track_phase("extract"):
+            fields = self._extract_fields(soup)
+
+        # Try JSON fallback and apply final formatting
+        with track_phase("json_fallback"):
+            fields = self._apply_fallbacks(*fields, json_matches, soup)
+
+        # Extract resource ID from URL
+        resource_id = None
+        match = re.search(r"/exchange/(\d+)/", resource_url)
+        if match:
+            resource_id = int(match.group(1))
+
+        res = {"resource_id": resource_id, "url": resource_url, **fields}
+
+        try:
+            page.close()
+        except Exception:
+            pass
+
+        return res
 
-        # Extract all fields using helper methods
+    def _extract_fields(self, soup) -> Tuple:
+        """
+        Extract fields from the page with CSS selectors
+        Returns (title, developer_id, version, updated_date, tagline, contributor)
+        """
         title = self._extract_text_field(
             soup,
             [
@@ -510,32 +586,7 @@ class ScraperEngine:
             ],
         )
 
-        # Try JSON fallback and apply final formatting
-        fields = self._apply_fallbacks(
-            title,
-            developer_id,
-            version,
-            updated_date,
-            tagline,
-            contributor,
-            json_matches,
-            soup,
-        )
-
-        # Extract resource ID from URL
-        resource_id = None
-        match = re.search(r"/exchange/(\d+)/", resource_url)
-        if match:
-            resource_id = int(match.group(1))
-
-        res = {"resource_id": resource_id, "url": resource_url, **fields}
-
-        try:
-            page.close()
-        except Exception:
-            pass
-
-        return res
+        return title, developer_id, version, updated_date, tagline, contributor
 
     def _setup_browser(self, playwright):
         """Setup and return browser and context"""
@@ -590,6 +641,7 @@ class ScraperEngine:
             page.keyboard.press("Escape")
             time.sleep(1)
         except Exception as e:
+            record_failure("modal")
             self.log(f"  Error handling modal: {e}", "warning")
 
     def _try_click_load_more(self, page) -> Tuple[bool, int]:
@@ -622,9 +674,11 @@ class ScraperEngine:
             try:
                 btn.click(timeout=5000)
             except Exception:
+                record_retry("load_more_click")
                 try:
                     btn.click(force=True, timeout=5000)
                 except Exception:
+                    record_failure("load_more_click")
                     return False, current_links
 
             time.sleep(3)
@@ -660,6 +714,7 @@ class ScraperEngine:
                 time.sleep(2)
             return 0
         else:
+            record_retry("load_more")
             self.log(
                 f"    No new resources loaded (attempt {load_more_count}/{max_no_change})"
             )
@@ -685,7 +740,8 @@ class ScraperEngine:
                     page.query_selector_all("a[href*='/exchange/'][href*='/overview']")
                 )
 
-                clicked, new_links = self._try_click_load_more(page)
+                with track_phase("load_more"):
+                    clicked, new_links = self._try_click_load_more(page)
 
                 if clicked:
                     self.log(
@@ -709,6 +765,7 @@ class ScraperEngine:
                             break
 
             except Exception as e:
+                record_failure("load_more")
                 self.log(f"  Error during loading: {e}", "error")
                 consecutive_no_change += 1
                 if consecutive_no_change >= max_no_change:
@@ -746,6 +803,7 @@ class ScraperEngine:
             try:
                 resource_data = self.extract_resource_details(context, url)
                 results.append(resource_data)
+                record_resource()
 
                 title = resource_data.get("title", "Unknown")
                 version = resource_data.get("version", "")
@@ -755,6 +813,7 @@ class ScraperEngine:
                 time.sleep(0.5)
 
             except Exception as e:
+                record_failure("resource")
                 self.log(f"  ERROR scraping {url}: {e}", "error")
 
         return results
@@ -763,9 +822,10 @@ class ScraperEngine:
         """Store results and finalize job status"""
         if results and not self.should_stop:
             self.log(f"Storing {len(results)} resources in database...")
-            changes_detected = self.db_manager.store_scrape_results(
-                job_id=self.current_job_id, results=results
-            )
+            with track_phase("db_flush"):
+                changes_detected = self.db_manager.store_scrape_results(
+                    job_id=self.current_job_id, results=results
+                )
 
             elapsed = int((datetime.now(ADELAIDE_TZ) - self.start_time).total_seconds())
             self.db_manager.complete_job(
@@ -798,9 +858,9 @@ class ScraperEngine:
 
     def scrape_all(self, triggered_by: str = "manual"):
         """Main scraping function - scrapes all Exchange resources"""
+        # Stop/pause flags start cleared and are reset after each run, so a
+        # control request applied before this point is not lost
         self._is_running = True
-        self.should_stop = False
-        self.is_paused = False
         self.start_time = datetime.now(ADELAIDE_TZ)
 
         if self.current_job_id is None:
@@ -815,10 +875,12 @@ class ScraperEngine:
 
                 page = context.new_page()
                 page.set_default_navigation_timeout(self.settings.nav_timeout)
-                page.goto(self.settings.base_url, wait_until="networkidle")
+                with track_phase("navigation"):
+                    page.goto(self.settings.base_url, wait_until="networkidle")
                 time.sleep(2)
 
-                self._handle_modal_popups(page)
+                with track_phase("modal"):
+                    self._handle_modal_popups(page)
                 self._load_all_resources(page)
 
                 resource_links = self._collect_resource_links(page)
@@ -834,6 +896,7 @@ class ScraperEngine:
             self._finalize_job(results)
 
         except Exception as e:
+            record_failure("job")
             self.log(f"FATAL ERROR during scrape: {e}", "error")
             elapsed = (
                 int((datetime.now(ADELAIDE_TZ) - self.start_time).total_seconds())
@@ -847,6 +910,9 @@ class ScraperEngine:
             )
         finally:
             self._is_running = False
+            self.should_stop = False
+            self.is_paused = False
+            self._resume_event.set()
             self.current_job_id = None
             self.start_time = None
             self.current_progress = {
@@ -854,4 +920,7 @@ class ScraperEngine:
                 "total": 0,
                 "current_item": "",
                 "percentage": 0,
+                "avg_item_ms": None,
             }
+            self._avg_item_seconds = None
+            self._last_progress_time = None
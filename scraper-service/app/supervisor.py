@@ -0,0 +1,208 @@
+"""
+Supervisor - Runs the scraper CLI subprocess from the API's event loop
+Drains the child's stdout/stderr so it can never block on a full pipe, and
+records its output and process state in Postgres so that every API worker
+can report them
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from .database import ADELAIDE_TZ, DatabasePool
+from .log_writer import LogWriter
+
+try:
+    import psutil
+except ImportError:  # no resource usage
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Lines of child stderr copied into the activity log when it exits with an error
+FAILURE_TAIL_LINES = 20
+
+
+class OutputWriter(LogWriter):
+    """
+    Batches subprocess output into scrape_output (bounded to keep_lines)
+    Entries are (line, stream, job_id, timestamp); the stream takes the
+    place of the log level, so nothing is filtered out.
+    """
+
+    def __init__(self, database_url: str, keep_lines: int = 500, **kwargs):
+        super().__init__(database_url, min_level="debug", **kwargs)
+        self.keep_lines = max(1, keep_lines)
+
+    def _write_batch(self, batch: List[Tuple]):
+        self._db.add_worker_output(batch, keep=self.keep_lines)
+
+
+class ScrapeSupervisor:
+    """
+    Owns the scraper subprocess started by this API process (one at a time)
+
+    Output lines go to the output writer and the API logger. If the child
+    exits non-zero the tail of its stderr is logged as one error entry, so
+    crashes are visible in the activity log. PID, exit code and resource
+    usage (RSS and CPU time, including browser child processes) are saved
+    to the job's `worker` column when the child starts, every
+    sample_interval seconds and when it exits.
+    """
+
+    def __init__(
+        self,
+        db_pool: DatabasePool,
+        output_writer: Optional[OutputWriter] = None,
+        log_writer: Optional[LogWriter] = None,
+        sample_interval: float = 5.0,
+    ):
+        self.db_pool = db_pool
+        self.output_writer = output_writer
+        self.log_writer = log_writer
+        self.sample_interval = sample_interval
+        # Kept in memory only for the failure message
+        self._stderr_tail: deque = deque(maxlen=FAILURE_TAIL_LINES)
+
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.job_id: Optional[int] = None
+        self.started_at: Optional[datetime] = None
+        self.ended_at: Optional[datetime] = None
+        self.usage: Dict[str, Any] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self, cmd: Sequence[str], job_id: int) -> int:
+        """Start cmd for job_id and begin supervising it; returns the PID"""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        self.process = process
+        self.job_id = job_id
+        self.started_at = datetime.now(ADELAIDE_TZ)
+        self.ended_at = None
+        self.usage = {"rss_bytes": None, "peak_rss_bytes": None, "cpu_seconds": None}
+        self._stderr_tail.clear()
+
+        drains = [
+            asyncio.create_task(self._drain(process.stdout, "stdout", job_id)),
+            asyncio.create_task(self._drain(process.stderr, "stderr", job_id)),
+        ]
+        self._tasks = drains + [
+            asyncio.create_task(self._wait(process, job_id, drains))
+        ]
+        return process.pid
+
+    async def close(self):
+        """Stop supervising (the child keeps running in its own session)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _drain(self, stream: asyncio.StreamReader, name: str, job_id: int):
+        """Read one pipe line by line until EOF"""
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Line longer than the stream limit (already discarded)
+                line = b"[line truncated]\n"
+            if not line:
+                break
+            text = line.decode("utf-8", errors="replace").rstrip()
+            if not text:
+                continue
+            if name == "stderr":
+                self._stderr_tail.append(text)
+            logger.debug(f"[job #{job_id} {name}] {text}")
+            if self.output_writer:
+                self.output_writer.write(text, name, job_id)
+
+    async def _wait(
+        self,
+        process: asyncio.subprocess.Process,
+        job_id: int,
+        drains: List[asyncio.Task],
+    ):
+        """Sample resource usage until the child exits, then record the exit"""
+        while True:
+            await run_in_threadpool(self._sample, process.pid)
+            await run_in_threadpool(self._save_status, job_id)
+            try:
+                await asyncio.wait_for(process.wait(), timeout=self.sample_interval)
+                break
+            except asyncio.TimeoutError:
+                continue
+
+        # Collect the last lines first (bounded, in case a grandchild such as
+        # the browser still holds the pipes open)
+        await asyncio.wait(drains, timeout=5.0)
+        self.ended_at = datetime.now(ADELAIDE_TZ)
+        self.usage["rss_bytes"] = None
+        await run_in_threadpool(self._save_status, job_id)
+
+        if process.returncode == 0:
+            logger.info(f"Scraper process for job #{job_id} exited")
+            return
+        message = f"Scraper process exited with code {process.returncode}"
+        if self._stderr_tail:
+            message += ":\n" + "\n".join(self._stderr_tail)
+        logger.error(f"Job #{job_id}: {message}")
+        if self.log_writer:
+            self.log_writer.write(message, "error", job_id)
+
+    def _sample(self, pid: int):
+        """Record RSS and CPU time of the child and its descendants"""
+        if psutil is None:
+            return
+        try:
+            parent = psutil.Process(pid)
+            processes = [parent] + parent.children(recursive=True)
+        except psutil.Error:
+            return
+
+        rss = 0
+        cpu = 0.0
+        for proc in processes:
+            try:
+                rss += proc.memory_info().rss
+                times = proc.cpu_times()
+                cpu += times.user + times.system
+            except psutil.Error:
+                continue
+
+        self.usage["rss_bytes"] = rss
+        self.usage["peak_rss_bytes"] = max(rss, self.usage.get("peak_rss_bytes") or 0)
+        self.usage["cpu_seconds"] = round(cpu, 2)
+
+    def _save_status(self, job_id: int):
+        """Write status() to the job row (errors are logged, not raised)"""
+        try:
+            with self.db_pool.connection() as db:
+                db.update_worker_status(job_id, self.status())
+        except Exception as e:
+            logger.warning(f"Could not save worker status for job #{job_id}: {e}")
+
+    def status(self) -> Optional[Dict[str, Any]]:
+        """The current (or last) child process, or None if none was started"""
+        if self.process is None:
+            return None
+        return {
+            "job_id": self.job_id,
+            "pid": self.process.pid,
+            "running": self.is_running(),
+            "exit_code": self.process.returncode,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+            **self.usage,
+        }
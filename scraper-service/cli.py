@@ -9,6 +9,9 @@ import sys
 
 from app.config import get_settings
 from app.database import DatabaseManager
+from app.events import EventPublisher
+from app.job_control import JobControlListener
+from app.log_writer import LogWriter
 from app.scraper_engine import ScraperEngine
 
 
@@ -33,14 +36,52 @@ def main():
     # Initialize
     settings = get_settings()
     db_manager = DatabaseManager(settings.database_url)
-    scraper_engine = ScraperEngine(db_manager=db_manager, headless=args.headless)
+    log_writer = LogWriter(
+        settings.database_url,
+        flush_interval=settings.log_flush_interval,
+        batch_size=settings.log_batch_size,
+        min_level=settings.db_log_level,
+        publish_events=True,
+    )
+    log_writer.start()
+    event_publisher = EventPublisher(
+        settings.database_url, min_interval=settings.progress_event_interval
+    )
+    scraper_engine = ScraperEngine(
+        db_manager=db_manager,
+        headless=args.headless,
+        log_writer=log_writer,
+        event_publisher=event_publisher,
+    )
 
     # Set the job ID (already created by API)
     scraper_engine.current_job_id = args.job_id
 
+    # Apply pause/resume/stop requests made through the API and keep the
+    # job's heartbeat fresh
+    job_control = JobControlListener(
+        settings.database_url,
+        args.job_id,
+        scraper_engine,
+        heartbeat_interval=settings.heartbeat_interval,
+    )
+    job_control.start()
+
     print(f"Starting scraper CLI for job #{args.job_id}")
 
+    locked = False
     try:
+        # Only one scrape at a time; the lock lives as long as this process
+        locked = db_manager.acquire_scrape_lock()
+        if not locked:
+            print("Another scrape is already running")
+            db_manager.fail_job(
+                args.job_id,
+                error_message="Another scrape is already running",
+                elapsed_seconds=0,
+            )
+            return 1
+
         # Run the scrape
         scraper_engine.scrape_all(triggered_by=args.triggered_by)
         print("Scrape completed successfully")
@@ -49,6 +90,12 @@ def main():
         print(f"Scrape failed: {e}")
         return 1
     finally:
+        job_control.close()
+        if locked:
+            db_manager.release_scrape_lock()
+        # Drain buffered log entries before the connection goes away
+        log_writer.close()
+        event_publisher.close()
         db_manager.close()
 
 
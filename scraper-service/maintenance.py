@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Maintenance CLI for database housekeeping tasks
+Runs independently of FastAPI and never loads the scraping stack
+"""
+
+import argparse
+import sys
+
+from app.config import get_settings
+from app.database import DatabaseManager
+from app.exporters import export_parquet
+
+
+def _format_bytes(num_bytes: int) -> str:
+    """Human readable byte count"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _int_at_least(minimum: int):
+    """argparse type for integers no smaller than minimum"""
+
+    def parse(value: str) -> int:
+        number = int(value)
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}")
+        return number
+
+    return parse
+
+
+def run_compact(args, db_manager: DatabaseManager) -> int:
+    """Compact old resource_history rows"""
+    summary = db_manager.compact_history(
+        older_than_days=args.older_than_days,
+        batch_size=args.batch_size,
+        dry_run=args.dry_run,
+    )
+
+    print(f"History older than {summary['cutoff']}")
+    print(f"  Redundant rows:      {summary['candidate_rows']}")
+    print(f"  Estimated savings:   {_format_bytes(summary['estimated_bytes_saved'])}")
+    if args.dry_run:
+        print("Dry run - nothing deleted")
+    else:
+        print(
+            f"  Deleted rows:        {summary['deleted_rows']} "
+            f"({summary['batches']} batches)"
+        )
+        print(f"  Vacuumed:            {', '.join(summary['vacuumed']) or '-'}")
+    return 0
+
+
+def run_export_parquet(args, db_manager: DatabaseManager) -> int:
+    """Append newly finished jobs to the Parquet dataset"""
+    summary = export_parquet(db_manager, args.output_dir)
+    exported = summary["exported_jobs"]
+    if exported:
+        print(
+            f"Exported {len(exported)} jobs (#{exported[0]}-#{exported[-1]}), "
+            f"{summary['history_rows']} history rows to {summary['export_dir']}"
+        )
+    else:
+        print(f"Nothing new to export in {summary['export_dir']}")
+    return 0
+
+
+def main():
+    """Run a maintenance subcommand"""
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(
+        description="Ignition Exchange Scraper maintenance"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compact = subparsers.add_parser(
+        "compact", help="Remove redundant 'unchanged' history rows and vacuum"
+    )
+    compact.add_argument(
+        "--older-than-days",
+        type=_int_at_least(0),
+        default=settings.compaction_older_than_days,
+        help="Only compact history older than this many days",
+    )
+    compact.add_argument(
+        "--batch-size",
+        type=_int_at_least(1),
+        default=settings.compaction_batch_size,
+        help="Rows deleted per transaction",
+    )
+    compact.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report expected savings without deleting anything",
+    )
+    compact.set_defaults(handler=run_compact)
+
+    export = subparsers.add_parser(
+        "export-parquet",
+        help="Append new jobs' resource_history and scrape_jobs to Parquet files",
+    )
+    export.add_argument(
+        "--output-dir",
+        default=settings.export_dir,
+        help="Dataset root (one job_id=N partition per job)",
+    )
+    export.set_defaults(handler=run_export_parquet)
+
+    args = parser.parse_args()
+
+    db_manager = DatabaseManager(settings.database_url)
+    try:
+        return args.handler(args, db_manager)
+    except Exception as e:
+        print(f"{args.command} failed: {e}")
+        return 1
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the job diff query (diff_jobs / GET /api/results/diff)
+
+Builds a synthetic history of JOBS x RESOURCES in the target database and
+times diff_jobs() for near and far job pairs.
+
+WARNING: truncates scrape_jobs, resource_history, exchange_resources and
+activity_log. Point it at a scratch database loaded with sql/schema.sql.
+
+Usage:
+    python scripts/benchmark_diff.py --database-url postgresql://... --reset
+    python scripts/benchmark_diff.py --database-url ... --reset --mode full
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import psycopg2
+
+SEED_SQL = """
+TRUNCATE resource_history, activity_log, exchange_resources, scrape_jobs
+    RESTART IDENTITY CASCADE;
+
+INSERT INTO scrape_jobs (id, status, job_start_time, job_end_time, resources_found)
+SELECT j, 'completed', LOCALTIMESTAMP, LOCALTIMESTAMP, %(resources)s
+FROM generate_series(1, %(jobs)s) j;
+
+SELECT setval('scrape_jobs_id_seq', %(jobs)s);
+
+-- Every resource is 'new' in job 1; afterwards each one changes version with
+-- probability change_rate per job. Delta mode keeps only the change rows.
+INSERT INTO resource_history (
+    resource_id, job_id, url, title, developer_id, version,
+    updated_date, tagline, contributor, scraped_at, change_type
+)
+SELECT
+    g.r,
+    g.j,
+    'https://inductiveautomation.com/exchange/' || g.r || '/overview',
+    'Resource ' || g.r,
+    (g.r %% 300)::TEXT,
+    '1.' || MAX(CASE WHEN g.changed THEN g.j END)
+        OVER (PARTITION BY g.r ORDER BY g.j) || '.0',
+    LOCALTIMESTAMP,
+    'Synthetic resource ' || g.r,
+    'Contributor ' || (g.r %% 300),
+    LOCALTIMESTAMP,
+    CASE WHEN g.j = 1 THEN 'new' WHEN g.changed THEN 'updated' ELSE 'unchanged' END
+FROM (
+    SELECT j, r, (j = 1 OR random() < %(change_rate)s) AS changed
+    FROM generate_series(1, %(jobs)s) j, generate_series(1, %(resources)s) r
+) g;
+"""
+
+
+def seed(conn, jobs: int, resources: int, change_rate: float, mode: str):
+    """Create the synthetic history"""
+    print(f"Seeding {jobs} jobs x {resources} resources ({mode} mode)...")
+    started = time.perf_counter()
+    with conn.cursor() as cur:
+        cur.execute(
+            SEED_SQL,
+            {"jobs": jobs, "resources": resources, "change_rate": change_rate},
+        )
+        if mode == "delta":
+            cur.execute("DELETE FROM resource_history WHERE change_type = 'unchanged'")
+        cur.execute("SELECT rebuild_history_validity()")
+        cur.execute("SELECT COUNT(*) FROM resource_history")
+        rows = cur.fetchone()[0]
+    conn.commit()
+
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute("VACUUM (ANALYZE) resource_history")
+    conn.autocommit = False
+    print(f"✓ {rows} history rows in {time.perf_counter() - started:.1f}s")
+
+
+def time_diff(conn, from_job: int, to_job: int, repeats: int):
+    """Return (median ms, added, removed, changed) for one job pair"""
+    timings = []
+    counts = {}
+    with conn.cursor() as cur:
+        for _ in range(repeats):
+            started = time.perf_counter()
+            cur.execute(
+                "SELECT change, COUNT(*) FROM diff_jobs(%s, %s) GROUP BY change",
+                (from_job, to_job),
+            )
+            counts = dict(cur.fetchall())
+            timings.append((time.perf_counter() - started) * 1000)
+    conn.rollback()
+    return (
+        statistics.median(timings),
+        counts.get("added", 0),
+        counts.get("removed", 0),
+        counts.get("changed", 0),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark diff_jobs()")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--resources", type=int, default=5000)
+    parser.add_argument("--change-rate", type=float, default=0.01)
+    parser.add_argument("--mode", choices=("delta", "full"), default="delta")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Required: confirms the target tables may be truncated",
+    )
+    args = parser.parse_args()
+
+    if not args.reset:
+        print("Refusing to run without --reset (this truncates the history tables)")
+        return 1
+
+    conn = psycopg2.connect(args.database_url)
+    try:
+        seed(conn, args.jobs, args.resources, args.change_rate, args.mode)
+
+        last = args.jobs
+        pairs = [
+            (last - 1, last),
+            (last // 2, last // 2 + 1),
+            (last - 10, last),
+            (last // 2, last),
+            (1, last),
+            (last, 1),
+        ]
+
+        print(
+            f"\n{'from':>6} {'to':>6} {'median ms':>10} {'added':>6} {'removed':>8} {'changed':>8}"
+        )
+        for from_job, to_job in pairs:
+            ms, added, removed, changed = time_diff(
+                conn, from_job, to_job, args.repeats
+            )
+            print(
+                f"{from_job:>6} {to_job:>6} {ms:>10.1f} {added:>6} {removed:>8} {changed:>8}"
+            )
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark for API response encoding (/api/results/latest payloads)
+
+Compares FastAPI's default path (jsonable_encoder + json.dumps) with the
+orjson encoder in app/responses.py, and the size/time of gzip and brotli
+compression, for synthetic catalogs of 500 to 50,000 resources.
+
+No database needed. Run from the repository root:
+    python scripts/benchmark_serialization.py
+    python scripts/benchmark_serialization.py --sizes 1000 20000 --repeats 10
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scraper-service"))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from app.responses import COMPRESSORS, dumps  # noqa: E402
+
+
+def make_payload(size: int) -> dict:
+    """A /api/results/latest body with `size` resources and all columns"""
+    base = datetime(2024, 1, 1, 9, 30)
+    results = [
+        {
+            "Resource ID": 1000 + i,
+            "Title": f"Perspective Component Pack {i}",
+            "URL": f"https://inductiveautomation.com/exchange/{1000 + i}/overview",
+            "Version": f"1.{i % 40}.{i % 7}",
+            "Updated Date": base + timedelta(hours=i),
+            "Developer ID": str(i % 300),
+            "Contributor": f"Contributor {i % 300}",
+            "Tagline": "Reusable views, templates and scripts for Ignition "
+            f"projects (variant {i % 13})",
+            "Last Scraped": base + timedelta(days=30, seconds=i),
+        }
+        for i in range(size)
+    ]
+    return {"success": True, "count": size, "results": results, "next_cursor": None}
+
+
+def default_encode(payload: dict) -> bytes:
+    """What fastapi.responses.JSONResponse does for a returned dict"""
+    return json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def timed(func, arg, repeats: int):
+    """Return (median ms, last result)"""
+    timings = []
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func(arg)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response encoding")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[500, 1000, 5000, 10000, 50000]
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    codings = list(COMPRESSORS)
+    header = f"{'resources':>9} {'default ms':>10} {'orjson ms':>9} {'speedup':>7} {'raw KB':>8}"
+    for coding in codings:
+        header += f" {coding + ' KB':>8} {coding + ' ms':>7}"
+    print(header)
+
+    for size in args.sizes:
+        payload = make_payload(size)
+        default_ms, default_body = timed(default_encode, payload, args.repeats)
+        orjson_ms, body = timed(dumps, payload, args.repeats)
+
+        if json.loads(default_body) != json.loads(body):
+            print(f"Encoders disagree at {size} resources")
+            return 1
+
+        line = (
+            f"{size:>9} {default_ms:>10.1f} {orjson_ms:>9.1f} "
+            f"{default_ms / orjson_ms:>6.1f}x {len(body) / 1024:>8.0f}"
+        )
+        for coding in codings:
+            ms, compressed = timed(COMPRESSORS[coding], body, args.repeats)
+            line += f" {len(compressed) / 1024:>8.0f} {ms:>7.1f}"
+        print(line)
+
+    print(
+        "\nCached results reuse the encoded and compressed body (PreparedBody), "
+        "so a hit costs neither column."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
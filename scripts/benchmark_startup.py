@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark for process startup cost of the API and scraper CLI entry points
+
+Imports each entry point in a fresh interpreter and reports the median
+import time, peak RSS after import and (from `python -X importtime`) the
+top-level packages that cost the most. Exits non-zero if an entry point
+goes over its budget, or if the API process loads any scraping-only
+package (Playwright, BeautifulSoup, lxml), so it can run in CI.
+
+No database needed. Run from the repository root:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --repeats 10 --top 15
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent / "scraper-service"
+
+# Entry point -> (module imported, import time budget ms, RSS budget MB).
+# The API's RSS budget sits below what importing the scraper engine costs
+# (about 64 MB), so a stray Playwright import shows up here as well.
+ENTRY_POINTS = {
+    "api": ("app.api", 1200.0, 60.0),
+    "cli": ("cli", 800.0, 80.0),
+}
+
+# Packages only the scraper worker may import
+WORKER_ONLY_PACKAGES = ("playwright", "bs4", "lxml")
+
+# Runs in the child: import the entry point and report cost as JSON
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({{
+    "import_ms": elapsed,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules": sorted({{name.split(".")[0] for name in sys.modules}}),
+}}))
+"""
+
+
+def probe(module: str, importtime: bool = False) -> dict:
+    """Import module in a fresh interpreter; with importtime, also parse its report"""
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", PROBE.format(module=module)]
+    result = subprocess.run(
+        cmd, cwd=SERVICE_DIR, capture_output=True, text=True, check=True
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    if importtime:
+        # "import time: self [us] | cumulative | imported package"
+        by_package = defaultdict(int)
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, _, name = line[len("import time:") :].split("|")
+            by_package[name.strip().split(".")[0]] += int(self_us)
+        report["packages_ms"] = {name: us / 1000 for name, us in by_package.items()}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark entry point startup")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Packages to list")
+    parser.add_argument(
+        "--entry", choices=list(ENTRY_POINTS), nargs="+", default=list(ENTRY_POINTS)
+    )
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'entry':>5} {'import ms':>9} {'budget':>7} {'RSS MB':>7} {'budget':>7}")
+    breakdowns = {}
+    for entry in args.entry:
+        module, budget_ms, budget_mb = ENTRY_POINTS[entry]
+        probe(module)  # warm the bytecode cache
+        runs = [probe(module) for _ in range(args.repeats)]
+        import_ms = statistics.median(run["import_ms"] for run in runs)
+        rss_mb = statistics.median(run["rss_mb"] for run in runs)
+        print(
+            f"{entry:>5} {import_ms:>9.0f} {budget_ms:>7.0f} "
+            f"{rss_mb:>7.1f} {budget_mb:>7.0f}"
+        )
+
+        if import_ms > budget_ms:
+            failures.append(f"{entry}: import {import_ms:.0f} ms > {budget_ms:.0f} ms")
+        if rss_mb > budget_mb:
+            failures.append(f"{entry}: RSS {rss_mb:.1f} MB > {budget_mb:.0f} MB")
+        if entry == "api":
+            loaded = set(runs[-1]["modules"]) & set(WORKER_ONLY_PACKAGES)
+            if loaded:
+                failures.append(f"api: imports worker-only {', '.join(sorted(loaded))}")
+
+        breakdowns[entry] = probe(module, importtime=True)["packages_ms"]
+
+    for entry, packages in breakdowns.items():
+        print(f"\nSlowest packages for {entry} (self time, -X importtime):")
+        ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        for name, ms in ranked[: args.top]:
+            print(f"  {name:<24} {ms:>7.1f} ms")
+
+    if failures:
+        print("\nOver budget:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark for API read throughput against the number of uvicorn workers
+
+Starts the API with 1, 2, 4... workers against the target database and
+drives a read endpoint from several client processes over keep-alive
+connections, reporting requests/second and latency percentiles.
+
+The result cache is disabled by default so every request queries Postgres;
+pass --cache to measure cached reads instead. Needs a database loaded with
+sql/schema.sql and some scrape history (see benchmark_diff.py --reset).
+Read-only; nothing is modified.
+
+Usage:
+    python scripts/benchmark_workers.py --database-url postgresql://...
+    python scripts/benchmark_workers.py --database-url ... --workers 1 2 4 8 \\
+        --path "/api/results/latest?limit=500" --clients 16 --duration 15
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent / "scraper-service"
+
+
+def wait_for_health(port: int, timeout: float = 30.0):
+    """Block until /health answers (or raise)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"API on port {port} did not become healthy")
+
+
+def client(port: int, path: str, duration: float, results):
+    """One client process: sequential requests on a keep-alive connection"""
+    latencies = []
+    errors = 0
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        try:
+            conn.request("GET", path, headers={"Accept-Encoding": "identity"})
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+                continue
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+    results.put((latencies, errors))
+
+
+def run_load(port: int, path: str, clients: int, duration: float):
+    """Return (requests/second, p50 ms, p95 ms, errors)"""
+    results = multiprocessing.Queue()
+    procs = [
+        multiprocessing.Process(target=client, args=(port, path, duration, results))
+        for _ in range(clients)
+    ]
+    for proc in procs:
+        proc.start()
+    latencies, errors = [], 0
+    for _ in procs:
+        batch, failed = results.get()
+        latencies.extend(batch)
+        errors += failed
+    for proc in procs:
+        proc.join()
+
+    if not latencies:
+        return 0.0, 0.0, 0.0, errors
+    quantiles = statistics.quantiles(latencies, n=20)
+    return (
+        len(latencies) / duration,
+        statistics.median(latencies),
+        quantiles[18],
+        errors,
+    )
+
+
+def benchmark(args, workers: int):
+    """Start the API with `workers` processes, warm it up and measure"""
+    env = {
+        **os.environ,
+        "DATABASE_URL": args.database_url,
+        "RESULT_CACHE_ENABLED": "true" if args.cache else "false",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.api:app",
+            "--port",
+            str(args.port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=SERVICE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_health(args.port)
+        run_load(args.port, args.path, args.clients, 2.0)  # warm-up
+        return run_load(args.port, args.path, args.clients, args.duration)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API worker scaling")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--path", default="/api/results/latest?limit=200")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds")
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--cache", action="store_true", help="Enable result cache")
+    args = parser.parse_args()
+
+    print(
+        f"GET {args.path} with {args.clients} clients, cache {'on' if args.cache else 'off'}"
+    )
+    print(
+        f"{'workers':>7} {'req/s':>8} {'scaling':>7} {'p50 ms':>7} {'p95 ms':>7} {'errors':>6}"
+    )
+    baseline = None
+    for workers in args.workers:
+        rate, p50, p95, errors = benchmark(args, workers)
+        baseline = baseline or rate
+        scaling = rate / baseline if baseline else 0.0
+        print(
+            f"{workers:>7} {rate:>8.0f} {scaling:>6.2f}x {p50:>7.1f} "
+            f"{p95:>7.1f} {errors:>6}"
+        )
+    # Scaling flattens once workers exceed the cores left after Postgres
+    print(f"\nCPUs available: {os.cpu_count()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,58 @@
 -- PostgreSQL 12+
 -- =====================================================
 
+-- Comparable key for a version string: the leading dotted numeric part as
+-- an integer array with trailing zero components dropped, so
+-- '1.3.0' -> {1,3}, '1.10' -> {1,10}, 'v2.1-beta' -> {2,1}. Arrays compare
+-- element by element, so {1,10} > {1,9}. NULL when there is no number.
+CREATE OR REPLACE FUNCTION parse_version_key(p_version TEXT)
+RETURNS INTEGER[] AS $$
+    SELECT string_to_array(
+        regexp_replace(
+            substring(p_version FROM '^\D*(\d{1,9}(?:\.\d{1,9})*)'),
+            '(\.0+)+$', ''
+        ),
+        '.'
+    )::INTEGER[];
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Upgrade from an unpartitioned schema: move the old resource_history and
+-- activity_log tables aside (freeing their constraint, sequence and index
+-- names) so the partitioned tables can be created below. Their rows are
+-- copied back and the old tables dropped after PARTITION MANAGEMENT.
+DO $$
+DECLARE
+    t TEXT;
+    idx RECORD;
+    fk RECORD;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['resource_history', 'activity_log'] LOOP
+        CONTINUE WHEN NOT EXISTS (
+            SELECT 1 FROM pg_class WHERE oid = to_regclass(t) AND relkind = 'r'
+        );
+        FOR idx IN
+            SELECT i.indexrelid::regclass AS name
+            FROM pg_index i
+            WHERE i.indrelid = to_regclass(t) AND NOT i.indisprimary
+        LOOP
+            EXECUTE format('DROP INDEX %s', idx.name);
+        END LOOP;
+        FOR fk IN
+            SELECT conname FROM pg_constraint
+            WHERE conrelid = to_regclass(t) AND contype = 'f'
+        LOOP
+            EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', t, fk.conname);
+        END LOOP;
+        EXECUTE format('ALTER TABLE %I RENAME CONSTRAINT %I TO %I',
+                       t, t || '_pkey', t || '_unpartitioned_pkey');
+        EXECUTE format('ALTER SEQUENCE %s RENAME TO %I',
+                       pg_get_serial_sequence(t, 'id'), t || '_unpartitioned_id_seq');
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', t, t || '_unpartitioned');
+        RAISE NOTICE 'Renamed unpartitioned % for migration', t;
+    END LOOP;
+END;
+$$;
+
 -- Main resources table
 CREATE TABLE IF NOT EXISTS exchange_resources (
     id SERIAL PRIMARY KEY,
@@ -11,6 +63,7 @@ CREATE TABLE IF NOT EXISTS exchange_resources (
     title TEXT NOT NULL,
     developer_id TEXT,
     version TEXT,
+    version_key INTEGER[] GENERATED ALWAYS AS (parse_version_key(version)) STORED,
     updated_date TIMESTAMP,
     tagline TEXT,
     contributor TEXT,
@@ -19,6 +72,11 @@ CREATE TABLE IF NOT EXISTS exchange_resources (
     is_deleted BOOLEAN DEFAULT FALSE
 );
 
+-- Columns added after the first release (no-ops on new databases)
+ALTER TABLE exchange_resources
+    ADD COLUMN IF NOT EXISTS version_key INTEGER[]
+        GENERATED ALWAYS AS (parse_version_key(version)) STORED;
+
 -- Scrape job history
 CREATE TABLE IF NOT EXISTS scrape_jobs (
     id SERIAL PRIMARY KEY,
@@ -29,24 +87,46 @@ CREATE TABLE IF NOT EXISTS scrape_jobs (
     changes_detected INTEGER DEFAULT 0,
     error_message TEXT,
     elapsed_seconds INTEGER,
-    triggered_by TEXT DEFAULT 'scheduled'  -- 'scheduled', 'manual', 'api'
+    triggered_by TEXT DEFAULT 'scheduled',  -- 'scheduled', 'manual', 'api'
+    control_action TEXT,  -- last 'pause', 'resume' or 'stop' request for the worker
+    heartbeat_at TIMESTAMP,  -- last liveness update from the worker process
+    worker JSONB  -- scraper subprocess pid, exit code and resource usage
 );
 
+ALTER TABLE scrape_jobs
+    ADD COLUMN IF NOT EXISTS control_action TEXT,
+    ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP,
+    ADD COLUMN IF NOT EXISTS worker JSONB;
+
 -- Resource history (tracks all changes over time)
+-- Range-partitioned by month on scraped_at; see ensure_monthly_partitions()
 CREATE TABLE IF NOT EXISTS resource_history (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     resource_id INTEGER NOT NULL,
     job_id INTEGER REFERENCES scrape_jobs(id) ON DELETE CASCADE,
     url TEXT NOT NULL,
     title TEXT,
     developer_id TEXT,
     version TEXT,
+    version_key INTEGER[] GENERATED ALWAYS AS (parse_version_key(version)) STORED,
     updated_date TIMESTAMP,
     tagline TEXT,
     contributor TEXT,
-    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    change_type TEXT  -- 'new', 'updated', 'unchanged'
-);
+    scraped_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    change_type TEXT,  -- 'new', 'updated', 'metadata', 'unchanged', 'deleted'
+    -- Row state is valid for jobs in [job_id, valid_to_job); NULL = current
+    valid_to_job INTEGER,
+    PRIMARY KEY (id, scraped_at)
+) PARTITION BY RANGE (scraped_at);
+
+ALTER TABLE resource_history
+    ADD COLUMN IF NOT EXISTS version_key INTEGER[]
+        GENERATED ALWAYS AS (parse_version_key(version)) STORED,
+    ADD COLUMN IF NOT EXISTS valid_to_job INTEGER;
+
+-- Catches rows outside the pre-created monthly partitions
+CREATE TABLE IF NOT EXISTS resource_history_default
+    PARTITION OF resource_history DEFAULT;
 
 -- Configuration table (singleton)
 CREATE TABLE IF NOT EXISTS scraper_config (
@@ -70,14 +150,134 @@ CREATE TABLE IF NOT EXISTS scraper_config (
 -- Insert default config row
 INSERT INTO scraper_config (id) VALUES (1) ON CONFLICT (id) DO NOTHING;
 
+-- Statistics summary (singleton), maintained by the scraper in the same
+-- transaction as job/result writes so reads are a primary-key lookup
+CREATE TABLE IF NOT EXISTS scraper_stats (
+    id INTEGER PRIMARY KEY DEFAULT 1,
+    total_resources INTEGER NOT NULL DEFAULT 0,
+    total_jobs INTEGER NOT NULL DEFAULT 0,
+    completed_jobs INTEGER NOT NULL DEFAULT 0,
+    failed_jobs INTEGER NOT NULL DEFAULT 0,
+    last_scrape_time TIMESTAMP,
+    total_resources_found BIGINT NOT NULL DEFAULT 0,  -- summed over completed jobs
+    total_changes_detected INTEGER NOT NULL DEFAULT 0,
+    duration_p50_seconds NUMERIC,
+    duration_p95_seconds NUMERIC,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT single_stats CHECK (id = 1)
+);
+
+INSERT INTO scraper_stats (id) VALUES (1) ON CONFLICT (id) DO NOTHING;
+
+-- Per-day job rollups (day of job start)
+CREATE TABLE IF NOT EXISTS scraper_daily_stats (
+    day DATE PRIMARY KEY,
+    jobs_started INTEGER NOT NULL DEFAULT 0,
+    jobs_completed INTEGER NOT NULL DEFAULT 0,
+    jobs_failed INTEGER NOT NULL DEFAULT 0,
+    resources_found BIGINT NOT NULL DEFAULT 0,
+    changes_detected INTEGER NOT NULL DEFAULT 0,
+    total_elapsed_seconds BIGINT NOT NULL DEFAULT 0
+);
+
+-- Live progress of running jobs, written by the scrape worker at most
+-- every PROGRESS_EVENT_INTERVAL and read by /api/scrape/status.
+-- UNLOGGED: no WAL for the frequent updates; contents are disposable
+-- (emptied after a crash, rows removed when the job finishes).
+CREATE UNLOGGED TABLE IF NOT EXISTS scrape_progress (
+    job_id INTEGER PRIMARY KEY REFERENCES scrape_jobs(id) ON DELETE CASCADE,
+    current INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    current_item TEXT,
+    avg_item_ms INTEGER,  -- moving average time per scraped resource
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Latest stdout/stderr lines of the scraper subprocess, written by the API
+-- process supervising it so that any API worker can serve /api/scrape/output.
+-- UNLOGGED and bounded: only the most recent job's last lines are kept.
+CREATE UNLOGGED TABLE IF NOT EXISTS scrape_output (
+    id BIGSERIAL PRIMARY KEY,
+    job_id INTEGER NOT NULL REFERENCES scrape_jobs(id) ON DELETE CASCADE,
+    stream TEXT NOT NULL,  -- 'stdout' or 'stderr'
+    line TEXT NOT NULL,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Activity log
+-- Range-partitioned by month on timestamp so retention drops whole partitions
 CREATE TABLE IF NOT EXISTS activity_log (
-    id SERIAL PRIMARY KEY,
-    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    id SERIAL,
+    timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     level TEXT NOT NULL,  -- 'info', 'warning', 'error'
     message TEXT NOT NULL,
-    job_id INTEGER REFERENCES scrape_jobs(id) ON DELETE SET NULL
-);
+    job_id INTEGER REFERENCES scrape_jobs(id) ON DELETE SET NULL,
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+CREATE TABLE IF NOT EXISTS activity_log_default
+    PARTITION OF activity_log DEFAULT;
+
+-- =====================================================
+-- FULL-TEXT SEARCH
+-- =====================================================
+
+-- Weighted search document for a resource (title > tagline > contributor).
+-- Uses the 'simple' configuration (no stemming) so prefix queries typed
+-- into a search box keep matching as each character is added.
+CREATE OR REPLACE FUNCTION resource_search_vector(
+    p_title TEXT,
+    p_tagline TEXT,
+    p_contributor TEXT
+)
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('simple', COALESCE(p_title, '')), 'A')
+        || setweight(to_tsvector('simple', COALESCE(p_tagline, '')), 'B')
+        || setweight(to_tsvector('simple', COALESCE(p_contributor, '')), 'C');
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Turn free text into a prefix query: every word must match the start of a
+-- lexeme ("perspective comp" -> 'perspective':* & 'comp':*). Punctuation is
+-- discarded, so user input can never produce a tsquery syntax error.
+-- Returns NULL when the input has no searchable words.
+CREATE OR REPLACE FUNCTION resource_search_query(p_query TEXT)
+RETURNS tsquery AS $$
+    SELECT to_tsquery('simple', string_agg(term || ':*', ' & '))
+    FROM regexp_split_to_table(lower(COALESCE(p_query, '')), '[^[:alnum:]]+') AS term
+    WHERE term <> '';
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Ranked, paginated search over the live catalog. Matches are ordered by
+-- ts_rank_cd, then resource_id so pages are stable; total_count is the
+-- number of matches before LIMIT/OFFSET.
+CREATE OR REPLACE FUNCTION search_resources(
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 25,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    resource_id INTEGER,
+    title TEXT,
+    url TEXT,
+    version TEXT,
+    updated_date TIMESTAMP,
+    developer_id TEXT,
+    contributor TEXT,
+    tagline TEXT,
+    rank REAL,
+    total_count BIGINT
+) AS $$
+    SELECT r.resource_id, r.title, r.url, r.version, r.updated_date,
+           r.developer_id, r.contributor, r.tagline,
+           ts_rank_cd(resource_search_vector(r.title, r.tagline, r.contributor), q.query) AS rank,
+           COUNT(*) OVER () AS total_count
+    FROM exchange_resources r,
+         resource_search_query(p_query) AS q(query)
+    WHERE r.is_deleted = FALSE
+      AND resource_search_vector(r.title, r.tagline, r.contributor) @@ q.query
+    ORDER BY rank DESC, r.resource_id
+    LIMIT p_limit OFFSET p_offset;
+$$ LANGUAGE sql STABLE;
 
 -- =====================================================
 -- INDEXES
@@ -86,15 +286,363 @@ CREATE TABLE IF NOT EXISTS activity_log (
 CREATE INDEX IF NOT EXISTS idx_resources_updated ON exchange_resources(updated_date DESC);
 CREATE INDEX IF NOT EXISTS idx_resources_resource_id ON exchange_resources(resource_id);
 CREATE INDEX IF NOT EXISTS idx_resources_is_deleted ON exchange_resources(is_deleted);
+-- Keyset pagination and filters over the live catalog (/api/results/latest)
+CREATE INDEX IF NOT EXISTS idx_resources_active ON exchange_resources(resource_id)
+    WHERE is_deleted = FALSE;
+CREATE INDEX IF NOT EXISTS idx_resources_contributor ON exchange_resources(contributor, resource_id)
+    WHERE is_deleted = FALSE;
+CREATE INDEX IF NOT EXISTS idx_resources_version ON exchange_resources(version, resource_id)
+    WHERE is_deleted = FALSE;
+CREATE INDEX IF NOT EXISTS idx_resources_updated_active ON exchange_resources(updated_date, resource_id)
+    WHERE is_deleted = FALSE;
+CREATE INDEX IF NOT EXISTS idx_resources_version_key ON exchange_resources(version_key, resource_id)
+    WHERE is_deleted = FALSE;
+-- Full-text search (/api/resources/search, SearchResources named query)
+CREATE INDEX IF NOT EXISTS idx_resources_search ON exchange_resources
+    USING GIN (resource_search_vector(title, tagline, contributor))
+    WHERE is_deleted = FALSE;
 CREATE INDEX IF NOT EXISTS idx_history_job_id ON resource_history(job_id);
 CREATE INDEX IF NOT EXISTS idx_history_resource_id ON resource_history(resource_id);
 CREATE INDEX IF NOT EXISTS idx_history_change_type ON resource_history(change_type);
+CREATE INDEX IF NOT EXISTS idx_history_resource_job ON resource_history(resource_id, job_id DESC);
+-- Version changes since a job (/api/results/updated-since)
+CREATE INDEX IF NOT EXISTS idx_history_version_changes ON resource_history(job_id, version_key)
+    WHERE change_type IN ('new', 'updated');
+-- Point-in-time lookups: rows whose validity range contains a job id
+CREATE INDEX IF NOT EXISTS idx_history_validity ON resource_history
+    USING GIST (int4range(job_id, valid_to_job, '[)'));
+-- Open (current) row per resource, closed when the next delta arrives
+CREATE INDEX IF NOT EXISTS idx_history_open ON resource_history(resource_id)
+    WHERE valid_to_job IS NULL;
 CREATE INDEX IF NOT EXISTS idx_jobs_status ON scrape_jobs(status);
 CREATE INDEX IF NOT EXISTS idx_jobs_start_time ON scrape_jobs(job_start_time DESC);
+-- Active job lookup (/api/scrape/status)
+CREATE INDEX IF NOT EXISTS idx_jobs_active ON scrape_jobs(job_start_time DESC)
+    WHERE status IN ('running', 'paused');
+CREATE INDEX IF NOT EXISTS idx_output_job ON scrape_output(job_id, id);
 CREATE INDEX IF NOT EXISTS idx_log_timestamp ON activity_log(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_log_job_id ON activity_log(job_id);
 CREATE INDEX IF NOT EXISTS idx_log_level ON activity_log(level);
 
+-- =====================================================
+-- PARTITION MANAGEMENT
+-- =====================================================
+
+-- Create monthly partitions for the current month and the next
+-- p_months_ahead months. Idempotent; called on every job creation.
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    p_table TEXT,
+    p_months_ahead INTEGER DEFAULT 3
+)
+RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE := date_trunc('month', LOCALTIMESTAMP)::DATE;
+    part_start DATE;
+    part_name TEXT;
+    created_count INTEGER := 0;
+BEGIN
+    FOR i IN 0..p_months_ahead LOOP
+        part_start := (month_start + make_interval(months => i))::DATE;
+        part_name := format('%s_p%s', p_table, to_char(part_start, 'YYYY_MM'));
+
+        IF to_regclass(part_name) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    part_name, p_table, part_start,
+                    (part_start + INTERVAL '1 month')::DATE
+                );
+                created_count := created_count + 1;
+            EXCEPTION
+                WHEN duplicate_table THEN
+                    NULL;  -- created concurrently
+                WHEN check_violation THEN
+                    RAISE WARNING 'Cannot create %: default partition holds rows for that month',
+                        part_name;
+            END;
+        END IF;
+    END LOOP;
+
+    RETURN created_count;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT ensure_monthly_partitions('resource_history');
+SELECT ensure_monthly_partitions('activity_log');
+
+-- Finish the upgrade from an unpartitioned schema (see the top of this
+-- file): create monthly partitions for the months the old rows cover, copy
+-- the rows with their ids, continue the id sequence and drop the old table
+-- along with the views on it (recreated below).
+DO $$
+DECLARE
+    t TEXT;
+    legacy TEXT;
+    part_column TEXT;
+    part_start DATE;
+    part_name TEXT;
+    columns TEXT;
+    copied BIGINT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['resource_history', 'activity_log'] LOOP
+        legacy := t || '_unpartitioned';
+        CONTINUE WHEN to_regclass(legacy) IS NULL;
+        part_column := CASE t WHEN 'resource_history' THEN 'scraped_at' ELSE 'timestamp' END;
+
+        -- The partition key is NOT NULL in the new table
+        EXECUTE format('UPDATE %I SET %I = CURRENT_TIMESTAMP WHERE %I IS NULL',
+                       legacy, part_column, part_column);
+
+        FOR part_start IN EXECUTE format(
+            'SELECT DISTINCT date_trunc(''month'', %I)::DATE FROM %I', part_column, legacy
+        ) LOOP
+            part_name := format('%s_p%s', t, to_char(part_start, 'YYYY_MM'));
+            IF to_regclass(part_name) IS NULL THEN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    part_name, t, part_start, (part_start + INTERVAL '1 month')::DATE
+                );
+            END IF;
+        END LOOP;
+
+        -- Columns both tables have, except generated ones
+        SELECT string_agg(quote_ident(o.attname), ', ' ORDER BY o.attnum)
+        INTO columns
+        FROM pg_attribute o
+        JOIN pg_attribute n
+          ON n.attrelid = to_regclass(t) AND n.attname = o.attname
+         AND n.attnum > 0 AND NOT n.attisdropped AND n.attgenerated = ''
+        WHERE o.attrelid = to_regclass(legacy) AND o.attnum > 0 AND NOT o.attisdropped;
+
+        EXECUTE format('INSERT INTO %I (%s) SELECT %s FROM %I', t, columns, columns, legacy);
+        GET DIAGNOSTICS copied = ROW_COUNT;
+        EXECUTE format(
+            'SELECT setval(%L, COALESCE((SELECT MAX(id) FROM %I), 0) + 1, false)',
+            pg_get_serial_sequence(t, 'id'), t
+        );
+        EXECUTE format('DROP TABLE %I CASCADE', legacy);
+        RAISE NOTICE 'Migrated % rows into partitioned %', copied, t;
+    END LOOP;
+END;
+$$;
+
+-- =====================================================
+-- SNAPSHOT FUNCTIONS
+-- =====================================================
+
+-- Catalog as it stood after a given job: every history row whose validity
+-- range [job_id, valid_to_job) contains the job, unless it records a
+-- deletion. Served by the idx_history_validity GiST index.
+CREATE OR REPLACE FUNCTION get_results_as_of(p_job_id INTEGER)
+RETURNS TABLE (
+    resource_id INTEGER,
+    job_id INTEGER,
+    url TEXT,
+    title TEXT,
+    developer_id TEXT,
+    version TEXT,
+    updated_date TIMESTAMP,
+    tagline TEXT,
+    contributor TEXT,
+    scraped_at TIMESTAMP,
+    change_type TEXT
+) AS $$
+    SELECT rh.resource_id, rh.job_id, rh.url, rh.title, rh.developer_id, rh.version,
+           rh.updated_date, rh.tagline, rh.contributor, rh.scraped_at, rh.change_type
+    FROM resource_history rh
+    WHERE int4range(rh.job_id, rh.valid_to_job, '[)') @> p_job_id
+      AND rh.change_type <> 'deleted';
+$$ LANGUAGE sql STABLE;
+
+-- Differences between the catalog after two jobs. Only resources with a
+-- history row between the jobs can differ, so those are the candidates; each
+-- side's state is the latest row at or before that job (index lookup).
+-- 'changes' maps every differing field to its before/after values.
+CREATE OR REPLACE FUNCTION diff_jobs(p_from_job INTEGER, p_to_job INTEGER)
+RETURNS TABLE (
+    resource_id INTEGER,
+    change TEXT,  -- 'added', 'removed', 'changed'
+    title TEXT,
+    changes JSONB
+) AS $$
+    WITH candidates AS (
+        SELECT DISTINCT rh.resource_id
+        FROM resource_history rh
+        WHERE rh.job_id > LEAST(p_from_job, p_to_job)
+          AND rh.job_id <= GREATEST(p_from_job, p_to_job)
+    ),
+    sides AS (
+        SELECT
+            c.resource_id,
+            CASE WHEN b.change_type <> 'deleted' THEN
+                jsonb_build_object(
+                    'title', b.title, 'url', b.url, 'version', b.version,
+                    'updated_date', b.updated_date, 'developer_id', b.developer_id,
+                    'contributor', b.contributor, 'tagline', b.tagline
+                )
+            END AS before_state,
+            CASE WHEN a.change_type <> 'deleted' THEN
+                jsonb_build_object(
+                    'title', a.title, 'url', a.url, 'version', a.version,
+                    'updated_date', a.updated_date, 'developer_id', a.developer_id,
+                    'contributor', a.contributor, 'tagline', a.tagline
+                )
+            END AS after_state
+        FROM candidates c
+        LEFT JOIN LATERAL (
+            SELECT * FROM resource_history rh
+            WHERE rh.resource_id = c.resource_id AND rh.job_id <= p_from_job
+            ORDER BY rh.job_id DESC
+            LIMIT 1
+        ) b ON TRUE
+        LEFT JOIN LATERAL (
+            SELECT * FROM resource_history rh
+            WHERE rh.resource_id = c.resource_id AND rh.job_id <= p_to_job
+            ORDER BY rh.job_id DESC
+            LIMIT 1
+        ) a ON TRUE
+    )
+    SELECT
+        d.resource_id,
+        d.change,
+        COALESCE(d.after_state, d.before_state) ->> 'title',
+        d.changes
+    FROM (
+        SELECT
+            s.resource_id,
+            s.before_state,
+            s.after_state,
+            CASE
+                WHEN s.before_state IS NULL THEN 'added'
+                WHEN s.after_state IS NULL THEN 'removed'
+                ELSE 'changed'
+            END AS change,
+            (
+                SELECT jsonb_object_agg(
+                    f.key,
+                    jsonb_build_object(
+                        'before', COALESCE(s.before_state -> f.key, 'null'),
+                        'after', COALESCE(s.after_state -> f.key, 'null')
+                    )
+                )
+                FROM jsonb_object_keys(COALESCE(s.after_state, s.before_state)) AS f(key)
+                WHERE COALESCE(s.before_state -> f.key, 'null')
+                      IS DISTINCT FROM COALESCE(s.after_state -> f.key, 'null')
+            ) AS changes
+        FROM sides s
+        WHERE s.before_state IS NOT NULL OR s.after_state IS NOT NULL
+    ) d
+    WHERE d.changes IS NOT NULL
+    ORDER BY d.resource_id;
+$$ LANGUAGE sql STABLE;
+
+-- Version, title and updated date timeline of several resources, oldest
+-- first. One pass over idx_history_resource_job; rows where none of those
+-- changed since the resource's previous row are left out, except that a
+-- resource's first row and returns after a deletion are always included.
+CREATE OR REPLACE FUNCTION get_resource_history(p_resource_ids INTEGER[])
+RETURNS TABLE (
+    resource_id INTEGER,
+    job_id INTEGER,
+    scraped_at TIMESTAMP,
+    change_type TEXT,
+    title TEXT,
+    version TEXT,
+    updated_date TIMESTAMP,
+    previous_title TEXT,
+    previous_version TEXT,
+    previous_updated_date TIMESTAMP
+) AS $$
+    SELECT h.resource_id, h.job_id, h.scraped_at, h.change_type,
+           h.title, h.version, h.updated_date,
+           h.previous_title, h.previous_version, h.previous_updated_date
+    FROM (
+        SELECT rh.resource_id, rh.job_id, rh.scraped_at, rh.change_type,
+               rh.title, rh.version, rh.updated_date,
+               LAG(rh.title) OVER w AS previous_title,
+               LAG(rh.version) OVER w AS previous_version,
+               LAG(rh.updated_date) OVER w AS previous_updated_date,
+               LAG(rh.change_type) OVER w AS previous_change_type
+        FROM resource_history rh
+        WHERE rh.resource_id = ANY(p_resource_ids)
+        WINDOW w AS (PARTITION BY rh.resource_id ORDER BY rh.job_id, rh.id)
+    ) h
+    WHERE h.previous_change_type IS NULL
+       OR h.change_type = 'deleted'
+       OR h.previous_change_type = 'deleted'
+       OR h.title IS DISTINCT FROM h.previous_title
+       OR h.version IS DISTINCT FROM h.previous_version
+       OR h.updated_date IS DISTINCT FROM h.previous_updated_date
+    ORDER BY h.resource_id, h.job_id;
+$$ LANGUAGE sql STABLE;
+
+-- Recompute valid_to_job from the next history row of the same resource.
+-- Used after compaction removes rows, and to backfill existing history.
+CREATE OR REPLACE FUNCTION rebuild_history_validity(p_resource_ids INTEGER[] DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE resource_history rh
+    SET valid_to_job = n.next_job_id
+    FROM (
+        SELECT id, scraped_at,
+               LEAD(job_id) OVER (PARTITION BY resource_id ORDER BY job_id) AS next_job_id
+        FROM resource_history
+        WHERE p_resource_ids IS NULL OR resource_id = ANY(p_resource_ids)
+    ) n
+    WHERE rh.id = n.id
+      AND rh.scraped_at = n.scraped_at
+      AND rh.valid_to_job IS DISTINCT FROM n.next_job_id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Releases before delta history only set exchange_resources.is_deleted when
+-- a resource disappeared and wrote no history row, so its timeline just
+-- stops (or resumes with a 'new' row when it is listed again) and the last
+-- row would stay valid in every later snapshot. Give each such gap the
+-- 'deleted' row current releases write, at the first completed job after
+-- the resource was last seen. Rows that already have it are left alone, so
+-- re-running this is a no-op.
+INSERT INTO resource_history (
+    resource_id, job_id, url, title, developer_id, version,
+    updated_date, tagline, contributor, scraped_at, change_type
+)
+SELECT g.resource_id, d.id, g.url, g.title, g.developer_id, g.version,
+       g.updated_date, g.tagline, g.contributor,
+       COALESCE(d.job_end_time, d.job_start_time), 'deleted'
+FROM (
+    SELECT rh.*,
+           LEAD(rh.change_type) OVER w AS next_change_type,
+           LEAD(rh.job_id) OVER w AS next_job_id
+    FROM resource_history rh
+    WINDOW w AS (PARTITION BY rh.resource_id ORDER BY rh.job_id, rh.id)
+) g
+JOIN exchange_resources r ON r.resource_id = g.resource_id
+CROSS JOIN LATERAL (
+    -- last_scraped_date still marks the last sighting of a resource that
+    -- stayed deleted, even if compaction removed its trailing rows
+    SELECT j.id, j.job_start_time, j.job_end_time
+    FROM scrape_jobs j
+    WHERE j.status = 'completed'
+      AND j.id > g.job_id
+      AND (g.next_change_type IS NOT NULL
+           OR r.last_scraped_date IS NULL
+           OR j.job_start_time > r.last_scraped_date)
+    ORDER BY j.id
+    LIMIT 1
+) d
+WHERE g.change_type IS DISTINCT FROM 'deleted'
+  AND (
+      (g.next_change_type IS NULL AND r.is_deleted)
+      OR (g.next_change_type = 'new' AND d.id < g.next_job_id)
+  );
+
+SELECT rebuild_history_validity();
+
 -- =====================================================
 -- VIEWS
 -- =====================================================
@@ -116,7 +664,16 @@ WHERE r.is_deleted = FALSE
 ORDER BY r.resource_id;
 
 -- Changes from most recent scrape
+-- The scraped_at bound lets the planner prune resource_history to the
+-- partition(s) written by the latest job
 CREATE OR REPLACE VIEW vw_latest_changes AS
+WITH latest AS (
+    SELECT id, job_start_time, job_end_time
+    FROM scrape_jobs
+    WHERE status = 'completed'
+    ORDER BY id DESC
+    LIMIT 1
+)
 SELECT
     rh.resource_id AS "Resource ID",
     rh.title AS "Title",
@@ -129,15 +686,14 @@ SELECT
     rh.change_type AS "Change Type",
     rh.scraped_at AS "Scraped At"
 FROM resource_history rh
-INNER JOIN (
-    SELECT MAX(id) as latest_job_id
-    FROM scrape_jobs
-    WHERE status = 'completed'
-) latest ON rh.job_id = latest.latest_job_id
-WHERE rh.change_type IN ('new', 'updated')
+WHERE rh.job_id = (SELECT id FROM latest)
+  AND rh.scraped_at BETWEEN (SELECT job_start_time FROM latest)
+                        AND (SELECT job_end_time FROM latest)
+  AND rh.change_type IN ('new', 'updated')
 ORDER BY rh.resource_id;
 
 -- Previous results (second most recent completed scrape)
+-- Reconstructed from history deltas, so it works with delta-only storage
 CREATE OR REPLACE VIEW vw_previous_results AS
 SELECT
     rh.resource_id AS "Resource ID",
@@ -149,14 +705,14 @@ SELECT
     rh.contributor AS "Contributor",
     rh.tagline AS "Tagline",
     rh.scraped_at AS "Scraped At"
-FROM resource_history rh
-INNER JOIN (
+FROM (
     SELECT id as job_id
     FROM scrape_jobs
     WHERE status = 'completed'
     ORDER BY job_end_time DESC
     LIMIT 1 OFFSET 1
-) previous ON rh.job_id = previous.job_id
+) previous
+CROSS JOIN LATERAL get_results_as_of(previous.job_id) rh
 ORDER BY rh.resource_id;
 
 -- Recent jobs view (last 50 jobs)
@@ -196,51 +752,151 @@ LIMIT 1000;
 -- =====================================================
 
 -- Function to clean old logs (keep last 7 days)
+-- Drops whole monthly partitions once every row in them is past retention,
+-- so logs are kept for at least 7 days and at most one month longer.
+-- Only rows that landed in the default partition are deleted row by row.
 CREATE OR REPLACE FUNCTION cleanup_old_logs()
 RETURNS INTEGER AS $$
 DECLARE
-    deleted_count INTEGER;
+    cutoff TIMESTAMP := LOCALTIMESTAMP - INTERVAL '7 days';
+    part RECORD;
+    part_rows INTEGER;
+    deleted_count INTEGER := 0;
 BEGIN
-    DELETE FROM activity_log
-    WHERE timestamp < NOW() - INTERVAL '7 days';
+    FOR part IN
+        SELECT c.relname,
+               to_date(right(c.relname, 7), 'YYYY_MM') AS part_start
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'activity_log'::regclass
+          AND c.relname ~ '_p[0-9]{4}_[0-9]{2}$'
+    LOOP
+        IF part.part_start + INTERVAL '1 month' <= cutoff THEN
+            EXECUTE format('SELECT COUNT(*) FROM %I', part.relname) INTO part_rows;
+            EXECUTE format('DROP TABLE %I', part.relname);
+            deleted_count := deleted_count + part_rows;
+        END IF;
+    END LOOP;
+
+    DELETE FROM activity_log_default
+    WHERE timestamp < cutoff;
 
-    GET DIAGNOSTICS deleted_count = ROW_COUNT;
-    RETURN deleted_count;
+    GET DIAGNOSTICS part_rows = ROW_COUNT;
+    RETURN deleted_count + part_rows;
 END;
 $$ LANGUAGE plpgsql;
 
--- Function to get statistics
+-- Function to get statistics (single-row read of scraper_stats)
+DROP FUNCTION IF EXISTS get_scraper_stats();
 CREATE OR REPLACE FUNCTION get_scraper_stats()
 RETURNS TABLE (
     total_resources INTEGER,
     total_jobs INTEGER,
     last_scrape_time TIMESTAMP,
     avg_resources_per_scrape NUMERIC,
-    total_changes_detected INTEGER
+    total_changes_detected INTEGER,
+    completed_jobs INTEGER,
+    failed_jobs INTEGER,
+    duration_p50_seconds NUMERIC,
+    duration_p95_seconds NUMERIC,
+    updated_at TIMESTAMP
 ) AS $$
+    SELECT
+        s.total_resources,
+        s.total_jobs,
+        s.last_scrape_time,
+        CASE WHEN s.completed_jobs > 0
+             THEN s.total_resources_found::NUMERIC / s.completed_jobs
+        END,
+        s.total_changes_detected,
+        s.completed_jobs,
+        s.failed_jobs,
+        s.duration_p50_seconds,
+        s.duration_p95_seconds,
+        s.updated_at
+    FROM scraper_stats s
+    WHERE s.id = 1;
+$$ LANGUAGE sql STABLE;
+
+-- Rebuild scraper_stats and scraper_daily_stats from the source tables
+-- (initial backfill or repair; normal operation updates them incrementally)
+CREATE OR REPLACE FUNCTION refresh_scraper_stats()
+RETURNS VOID AS $$
 BEGIN
-    RETURN QUERY
+    UPDATE scraper_stats s
+    SET total_resources = (SELECT COUNT(*) FROM exchange_resources WHERE is_deleted = FALSE),
+        total_jobs = j.total_jobs,
+        completed_jobs = j.completed_jobs,
+        failed_jobs = j.failed_jobs,
+        last_scrape_time = j.last_scrape_time,
+        total_resources_found = j.total_resources_found,
+        total_changes_detected = j.total_changes_detected,
+        duration_p50_seconds = j.p50,
+        duration_p95_seconds = j.p95,
+        updated_at = CURRENT_TIMESTAMP
+    FROM (
+        SELECT
+            COUNT(*) AS total_jobs,
+            COUNT(*) FILTER (WHERE status = 'completed') AS completed_jobs,
+            COUNT(*) FILTER (WHERE status = 'failed') AS failed_jobs,
+            MAX(job_start_time) FILTER (WHERE status = 'completed') AS last_scrape_time,
+            COALESCE(SUM(resources_found) FILTER (WHERE status = 'completed'), 0)
+                AS total_resources_found,
+            COALESCE(SUM(changes_detected) FILTER (WHERE status = 'completed'), 0)
+                AS total_changes_detected,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY elapsed_seconds)
+                FILTER (WHERE status = 'completed') AS p50,
+            percentile_cont(0.95) WITHIN GROUP (ORDER BY elapsed_seconds)
+                FILTER (WHERE status = 'completed') AS p95
+        FROM scrape_jobs
+    ) j
+    WHERE s.id = 1;
+
+    DELETE FROM scraper_daily_stats;
+    INSERT INTO scraper_daily_stats (
+        day, jobs_started, jobs_completed, jobs_failed,
+        resources_found, changes_detected, total_elapsed_seconds
+    )
     SELECT
-        (SELECT COUNT(*)::INTEGER FROM exchange_resources WHERE is_deleted = FALSE),
-        (SELECT COUNT(*)::INTEGER FROM scrape_jobs),
-        (SELECT MAX(job_start_time) FROM scrape_jobs WHERE status = 'completed'),
-        (SELECT AVG(resources_found) FROM scrape_jobs WHERE status = 'completed'),
-        (SELECT SUM(changes_detected)::INTEGER FROM scrape_jobs WHERE status = 'completed');
+        job_start_time::DATE,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE status = 'completed'),
+        COUNT(*) FILTER (WHERE status = 'failed'),
+        COALESCE(SUM(resources_found) FILTER (WHERE status = 'completed'), 0),
+        COALESCE(SUM(changes_detected) FILTER (WHERE status = 'completed'), 0),
+        COALESCE(SUM(elapsed_seconds) FILTER (WHERE status = 'completed'), 0)
+    FROM scrape_jobs
+    GROUP BY job_start_time::DATE;
 END;
 $$ LANGUAGE plpgsql;
 
+SELECT refresh_scraper_stats();
+
 -- =====================================================
 -- COMMENTS
 -- =====================================================
 
 COMMENT ON TABLE exchange_resources IS 'Main table storing all Exchange resources';
 COMMENT ON TABLE scrape_jobs IS 'History of all scraping jobs';
-COMMENT ON TABLE resource_history IS 'Historical snapshot of resources for each scrape';
+COMMENT ON TABLE resource_history IS 'Resource changes per scrape (unchanged rows only in full history mode)';
 COMMENT ON TABLE scraper_config IS 'Configuration settings (singleton table)';
 COMMENT ON TABLE activity_log IS 'Application activity and error logs';
+COMMENT ON TABLE scraper_stats IS 'Incrementally maintained statistics summary (singleton table)';
+COMMENT ON TABLE scraper_daily_stats IS 'Per-day job count, resource and duration rollups';
+COMMENT ON TABLE scrape_progress IS 'Live progress of running jobs (unlogged, written by the worker)';
+COMMENT ON TABLE scrape_output IS 'Recent scraper subprocess output (unlogged, latest job only)';
 
 COMMENT ON VIEW vw_latest_results IS 'Most recent scrape results';
 COMMENT ON VIEW vw_latest_changes IS 'New or updated resources from latest scrape';
 COMMENT ON VIEW vw_previous_results IS 'Previous scrape results for comparison';
 COMMENT ON VIEW vw_recent_jobs IS 'Last 50 scraping jobs with formatted output';
 COMMENT ON VIEW vw_activity_log IS 'Last 1000 activity log entries';
+
+COMMENT ON FUNCTION parse_version_key(TEXT) IS 'Sortable integer-array key for a version string';
+COMMENT ON FUNCTION search_resources(TEXT, INTEGER, INTEGER) IS 'Ranked prefix full-text search over active resources';
+COMMENT ON FUNCTION get_results_as_of(INTEGER) IS 'Catalog snapshot as of a job, reconstructed from history deltas';
+COMMENT ON FUNCTION rebuild_history_validity(INTEGER[]) IS 'Recompute resource_history validity ranges';
+COMMENT ON FUNCTION diff_jobs(INTEGER, INTEGER) IS 'Added, removed and changed resources between two jobs';
+COMMENT ON FUNCTION get_resource_history(INTEGER[]) IS 'Version, title and date change timeline of several resources';
+COMMENT ON FUNCTION ensure_monthly_partitions(TEXT, INTEGER) IS 'Create current and upcoming monthly partitions';
+COMMENT ON FUNCTION cleanup_old_logs() IS 'Drop activity_log partitions past the 7 day retention';
@@ -0,0 +1,89 @@
+"""
+Tests for ResultCache request coalescing
+Run with: python -m pytest tests/test_cache.py
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.cache import ResultCache
+
+
+def make_cache() -> ResultCache:
+    cache = ResultCache()
+    cache.activate()
+    return cache
+
+
+def blocking_loader(release: threading.Event, calls: list, value="value"):
+    """Loader that blocks its worker thread until release is set"""
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return value
+
+    return load
+
+
+def test_concurrent_misses_share_one_load():
+    async def run():
+        cache = make_cache()
+        release, calls = threading.Event(), []
+        loader = blocking_loader(release, calls)
+        waiters = [asyncio.create_task(cache.get(("results", "x"), loader))]
+        waiters += [asyncio.create_task(cache.get(("results", "x"), loader))]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*waiters), calls
+
+    values, calls = asyncio.run(run())
+    assert values == ["value", "value"]
+    assert len(calls) == 1
+
+
+def test_cancelled_leader_does_not_strand_followers():
+    async def run():
+        cache = make_cache()
+        release, calls = threading.Event(), []
+        loader = blocking_loader(release, calls)
+        leader = asyncio.create_task(cache.get(("results", "x"), loader))
+        await asyncio.sleep(0.05)
+        follower = asyncio.create_task(cache.get(("results", "x"), loader))
+        await asyncio.sleep(0.05)
+
+        leader.cancel()
+        release.set()
+        value = await asyncio.wait_for(follower, timeout=2)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        # The shared load finished and was stored
+        cached = await cache.get(("results", "x"), lambda: "reloaded")
+        return value, cached, calls
+
+    value, cached, calls = asyncio.run(run())
+    assert value == "value"
+    assert cached == "value"
+    assert len(calls) == 1
+
+
+def test_loader_error_reaches_every_waiter():
+    async def run():
+        cache = make_cache()
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise RuntimeError("query failed")
+
+        waiters = [
+            asyncio.create_task(cache.get(("results", "x"), failing)) for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*waiters, return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)